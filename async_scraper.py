@@ -0,0 +1,421 @@
+"""
+Async scraping engine for TechFlow
+Same inputs and return shape as scraper.scrape_jobs(), but search fetches, detail
+fetches, URL shortening and channel sends overlap on one event loop. Blocking work
+(Selenium, Blogger API, Supabase, HTML parsing) runs in worker threads.
+"""
+import asyncio
+import random
+import time
+from collections import deque
+
+from http_client import AsyncHttpClient
+from driver_pool import reset_pool_stats
+import debug_capture
+from strategy_registry import get_registry
+from scraper import (
+    SEARCH_KEYWORDS, TARGET_JOBS_COUNT, DETAIL_FETCH_WORKERS, SEARCH_FETCH_WORKERS,
+    TINYURL_API_KEY, TELEGRAM_BOT_TOKEN, TELEGRAM_CHANNEL_ID,
+    WHATSAPP_API_TOKEN, WHATSAPP_PHONE_NUMBER_ID,
+    load_history, new_run_stats, connect_blogger, finish_scrape, count_skip,
+    get_search_url, parse_wuzzuf_search_html, new_keyword_state, next_wuzzuf_candidate,
+    apply_keyword_skips, settle_keyword, apply_leftover_skips, iter_wuzzuf_search_pages, extract_job_details, iter_indeed_jobs, parse_indeed_job, fill_skills_with_selenium,
+    near_duplicate_job, remember_job,
+    reset_existing_links_cache, prefetch_existing_links, wuzzuf_card_link,
+    create_slug, generate_blog_post_html, save_post_file, post_to_blogger, format_message,
+)
+
+
+async def create_tinyurl_async(client, long_url):
+    """Async version of scraper.create_tinyurl"""
+    try:
+        # Skip TinyURL for Indeed links (domain is banned)
+        if 'indeed.com' in long_url:
+            print(f"   ℹ️  Using direct Indeed link (TinyURL blocks Indeed domain)")
+            return long_url
+
+        headers = {
+            "Authorization": f"Bearer {TINYURL_API_KEY}",
+            "Content-Type": "application/json"
+        }
+        payload = {"url": long_url, "domain": "tinyurl.com"}
+        response = await client.post("https://api.tinyurl.com/create", json=payload, headers=headers, timeout=10)
+
+        if response.status_code == 200:
+            short_url = response.json().get('data', {}).get('tiny_url')
+            if short_url and short_url.startswith('http'):
+                return short_url
+        else:
+            print(f"   ⚠️  TinyURL API error: {response.status_code} - {response.text[:100]}")
+
+        # If API fails, return original URL
+        return long_url
+    except Exception as e:
+        print(f"   ⚠️  URL shortener error: {e}, using original URL")
+        return long_url
+
+
+async def send_to_telegram_async(client, message):
+    """Async version of scraper.send_to_telegram_channel"""
+    if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHANNEL_ID:
+        print("   ⚠️  Telegram Bot not configured. Skipping...")
+        return False
+
+    try:
+        print(f"   📤 Sending to Telegram Channel: {TELEGRAM_CHANNEL_ID}")
+        url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
+        payload = {
+            "chat_id": TELEGRAM_CHANNEL_ID,
+            "text": message,
+            "parse_mode": "Markdown",
+            "disable_web_page_preview": False
+        }
+        response = await client.post(url, json=payload, timeout=10)
+
+        if response.status_code == 200:
+            print(f"   ✅ Sent to Telegram Channel successfully")
+            return True
+        print(f"   ❌ Telegram API error: {response.status_code}")
+        print(f"   Response: {response.text}")
+        return False
+    except Exception as e:
+        print(f"   ❌ Telegram send error: {e}")
+        return False
+
+
+async def send_to_whatsapp_async(client, message):
+    """Async version of scraper.send_to_whatsapp_channel"""
+    if not WHATSAPP_API_TOKEN or not WHATSAPP_PHONE_NUMBER_ID:
+        print("   ⚠️  WhatsApp API not configured. Skipping...")
+        return False
+
+    try:
+        url = f"https://graph.facebook.com/v18.0/{WHATSAPP_PHONE_NUMBER_ID}/messages"
+        headers = {
+            "Authorization": f"Bearer {WHATSAPP_API_TOKEN}",
+            "Content-Type": "application/json"
+        }
+        payload = {
+            "messaging_product": "whatsapp",
+            "to": 201013414748,  # Channel ID
+            "type": "text",
+            "text": {"body": message}
+        }
+        response = await client.post(url, json=payload, headers=headers, timeout=10)
+
+        if response.status_code == 200:
+            print(f"   ✅ Sent to WhatsApp Channel")
+            return True
+        print(f"   ❌ WhatsApp API error: {response.status_code} - {response.text[:100]}")
+        return False
+    except Exception as e:
+        print(f"   ❌ WhatsApp send error: {e}")
+        return False
+
+
+async def verify_blogger_post_async(client, blog_url, max_retries=3):
+    """Async version of scraper.verify_blogger_post"""
+    if not blog_url:
+        return False
+
+    for attempt in range(max_retries):
+        try:
+            response = await client.get(blog_url, timeout=10, retry_statuses=())
+            if response.status_code == 200:
+                print(f"   ✅ Blog post verified: {blog_url}")
+                return True
+            print(f"   ⚠️  Blog verification attempt {attempt + 1}/{max_retries}: Status {response.status_code}")
+        except Exception as e:
+            print(f"   ⚠️  Blog verification attempt {attempt + 1}/{max_retries} failed: {e}")
+        await asyncio.sleep(2)
+
+    print(f"   ❌ Blog post verification failed after {max_retries} attempts")
+    return False
+
+
+async def fetch_wuzzuf_search_pages_async(client, keywords, max_workers=None):
+    """Async version of scraper.fetch_wuzzuf_search_pages"""
+    limit = asyncio.Semaphore(max_workers or SEARCH_FETCH_WORKERS)
+
+    async def fetch(keyword):
+        async with limit:
+            print(f"Fetching jobs for: {keyword}...")
+            try:
+                response = await client.get(get_search_url(keyword), use_cache=True)
+                job_cards = await asyncio.to_thread(parse_wuzzuf_search_html, response.content)
+                print(f"Found {len(job_cards)} potential jobs for {keyword}...")
+                return keyword, job_cards
+            except Exception as e:
+                print(f"Error fetching {keyword}: {e}")
+                return keyword, None
+
+    return dict(await asyncio.gather(*(fetch(keyword) for keyword in keywords)))
+
+
+async def get_job_details_async(client, job_url, use_selenium_for_skills=False):
+    """Async version of scraper.get_job_details (parsing runs in a worker thread)"""
+    try:
+        response = await client.get(job_url, use_cache=True)
+        return await asyncio.to_thread(extract_job_details, response.content, job_url, use_selenium_for_skills)
+    except Exception as e:
+        print(f"Error fetching details for {job_url}: {e}")
+        return None
+
+
+async def publish_job_async(client, job, blog_posts_html, blogger_service=None, upload=False, save_posts=True,
+                            use_tinyurl=True, send_whatsapp=False, send_telegram=False, blogger_lock=None):
+    """
+    Async version of scraper.publish_job - the channel sends for a job go out concurrently.
+    blogger_lock serializes post_to_blogger: the googleapiclient service (httplib2)
+    is not thread-safe, so concurrent publishes must not share it at the same time.
+    """
+    title = job['title']
+    slug = job.get('slug') or create_slug(title)
+
+    blog_html = await asyncio.to_thread(generate_blog_post_html, job)
+    blog_posts_html.append(f"<!-- {slug} -->\n{blog_html}\n<hr>\n")
+
+    if save_posts:
+        await asyncio.to_thread(save_post_file, job, slug, blog_html)
+
+    posted_to_blogger = False
+    blog_link = None
+
+    if upload and blogger_service:
+        print(f"   📤 Attempting to post to Blogger: {title}")
+        async with blogger_lock or asyncio.Lock():
+            real_url = await asyncio.to_thread(post_to_blogger, blogger_service, title, blog_html)
+
+        if real_url and await verify_blogger_post_async(client, real_url):
+            blog_link = real_url
+            posted_to_blogger = True
+            job['blog_link'] = blog_link
+            print(f"   ✅ Blog post verified and accessible")
+        else:
+            print(f"   ⚠️  Blog post failed verification, using original link")
+    elif upload and not blogger_service:
+        print(f"   ⚠️  Skipping Blogger post - service is None (auth failed)")
+
+    link = blog_link if posted_to_blogger else job['link']
+    message_link = await create_tinyurl_async(client, link) if use_tinyurl else link
+
+    if send_whatsapp or send_telegram:
+        # format_message() shortens apply_link itself when use_tinyurl is set; do that
+        # here without blocking the loop and hand it the already-short link
+        if use_tinyurl:
+            message_link = await create_tinyurl_async(client, message_link)
+        message = format_message(job, message_link, use_tinyurl=False)
+
+        sends = {}
+        if send_whatsapp:
+            sends['sent_to_whatsapp'] = send_to_whatsapp_async(client, message)
+        if send_telegram:
+            sends['sent_to_telegram'] = send_to_telegram_async(client, message)
+        results = await asyncio.gather(*sends.values())
+        job.update(zip(sends.keys(), results))
+
+    job['posted_to_blogger'] = posted_to_blogger
+    return job
+
+
+def select_indeed_jobs(history, stats, limit):
+    """
+    Pull Indeed jobs on demand (worker thread) until `limit` pass parse_indeed_job;
+    the browser stops searching as soon as we have them
+    """
+    accepted = []
+    indeed_jobs = iter_indeed_jobs(history, stats)
+    for job in indeed_jobs:
+        skip_reason = parse_indeed_job(job, history, check_db=False)
+        if skip_reason:
+            count_skip(stats, skip_reason)
+            continue
+        accepted.append(job)
+        remember_job(history, job)
+        stats["indeed"]["scraped"] += 1
+        if len(accepted) >= limit:
+            break
+    indeed_jobs.close()
+    return accepted
+
+
+async def scrape_jobs_async(upload=False, save_posts=True, use_selenium_skills=False, send_whatsapp=False, send_telegram=False, max_jobs=None, include_indeed=False, wuzzuf_only=False, indeed_only=False, use_tinyurl=True):
+    """
+    Async variant of scraper.scrape_jobs() with the same arguments and
+    {"jobs": [...], "stats": {...}} result. Selection (one job per keyword,
+    target cut-off, skip accounting) follows the same rules; accepted jobs are
+    published in the background while selection continues.
+    """
+    start_time = time.time()
+    target_jobs = max_jobs if max_jobs is not None else TARGET_JOBS_COUNT
+
+    history = await asyncio.to_thread(load_history)
+    await asyncio.to_thread(reset_existing_links_cache)
+    reset_pool_stats()
+    debug_capture.reset_page_count()
+    get_registry().reset_session()
+    new_jobs = []
+    blog_posts_html = []
+    stats = new_run_stats()
+    publish_tasks = []
+
+    run_indeed = (include_indeed or indeed_only) and not wuzzuf_only
+
+    async with AsyncHttpClient() as client:
+        # Blogger auth, the Indeed browser run and the Wuzzuf search fan-out all start together
+        blogger_task = asyncio.create_task(asyncio.to_thread(connect_blogger)) if upload else None
+
+        indeed_task = None
+        if run_indeed:
+            indeed_max = target_jobs if indeed_only else target_jobs // 2
+            indeed_task = asyncio.create_task(asyncio.to_thread(
+                select_indeed_jobs, history, stats, min(max(indeed_max, 1), target_jobs)))
+
+        search_task = None
+        keywords = []
+        if not indeed_only:
+            keywords = list(SEARCH_KEYWORDS)
+            random.shuffle(keywords)
+            print(f"\n🔍 Searching Wuzzuf for jobs in categories: {', '.join(keywords)}")
+            search_task = asyncio.create_task(fetch_wuzzuf_search_pages_async(client, keywords))
+
+        blogger_service = await blogger_task if blogger_task else None
+        blogger_lock = asyncio.Lock()  # One Blogger request at a time on the shared service
+
+        def publish(job):
+            publish_tasks.append((job, asyncio.create_task(publish_job_async(
+                client, job, blog_posts_html, blogger_service, upload=upload, save_posts=save_posts,
+                use_tinyurl=use_tinyurl, send_whatsapp=send_whatsapp, send_telegram=send_telegram,
+                blogger_lock=blogger_lock))))
+
+        # ============ INDEED ============
+        if indeed_task:
+            for job in await indeed_task:
+                publish(job)
+                new_jobs.append(job)
+
+        # ============ WUZZUF ============
+        if search_task:
+            search_pool = await search_task
+            print(f"Target: {target_jobs} jobs (currently have {len(new_jobs)} from Indeed)")
+
+            known_links = history.snapshot()  # Pagination stops at links seen before this run
+            first_page_links = [wuzzuf_card_link(card) for cards in search_pool.values() if cards for card in cards]
+            # History lookups are SQLite reads - keep them off the event loop too
+            await asyncio.to_thread(
+                lambda: prefetch_existing_links([link for link in first_page_links if link not in history]))
+            keyword_queue = deque()
+            keyword_iter = iter(keywords)
+            keyword_states = []
+            revisit = deque()  # Keywords waiting for another round
+            reserved_links = set()  # Links with a detail fetch in flight
+            skills_queue = []  # Accepted jobs waiting for Selenium skills (use_selenium_skills)
+
+            async def submit_candidate(state):
+                state["candidate"] = await asyncio.to_thread(next_wuzzuf_candidate, state, history, reserved_links)
+                state["future"] = None
+                if state["candidate"]:
+                    reserved_links.add(state["candidate"]["link"])
+                    print(f"Scraping details for: {state['candidate']['title']}")
+                    state["future"] = asyncio.create_task(get_job_details_async(
+                        client, state["candidate"]["link"]))
+
+            def next_keyword_state():
+                keyword = next(keyword_iter, None)
+                if keyword is not None:
+                    cards = search_pool[keyword]
+                    # Further result pages are fetched (blocking) inside next_wuzzuf_candidate,
+                    # which already runs in a worker thread
+                    state = new_keyword_state(keyword, cards, iter_wuzzuf_search_pages(keyword, known_links, first_page=cards))
+                    keyword_states.append(state)
+                    return state
+                if revisit:
+                    state = revisit.popleft()
+                    print(f"🔁 Still short of the target, looking for another {state['keyword']} job...")
+                    return state
+                return None
+
+            async def fill_queue():
+                while sum(1 for s in keyword_queue if s["future"] is not None) < min(DETAIL_FETCH_WORKERS, target_jobs - len(new_jobs)):
+                    state = next_keyword_state()
+                    if state is None:
+                        return
+                    if state["fetched"]:
+                        await submit_candidate(state)
+                    keyword_queue.append(state)
+
+            await fill_queue()
+            while keyword_queue and len(new_jobs) < target_jobs:
+                state = keyword_queue.popleft()
+                state["leftover"] = None
+
+                while state["future"] is not None:
+                    candidate = state["candidate"]
+                    details = await state["future"]
+                    reserved_links.discard(candidate["link"])
+                    apply_keyword_skips(stats, state)
+
+                    if details:
+                        job_data = {
+                            "title": candidate["title"],
+                            "location": candidate["location"],
+                            "link": candidate["link"],
+                            "company": candidate["company"],
+                            "requirements": details.get("requirements", []),
+                            "description": details.get("description", ""),
+                            "skills": details.get("skills", []),
+                            "company_logo": details.get("company_logo", ""),
+                            "keyword": state["keyword"],
+                            "source": "wuzzuf"
+                        }
+                        duplicate_of = await asyncio.to_thread(near_duplicate_job, history, job_data)
+                        if duplicate_of:
+                            print(f"   ⏭️  Skipped (near-duplicate of {duplicate_of}): {job_data['title']}")
+                            await asyncio.to_thread(history.add, candidate["link"])
+                            count_skip(stats, "duplicate")
+                            await submit_candidate(state)
+                            continue
+                        if use_selenium_skills and not job_data["skills"]:
+                            # Static parse found no skills - published after the browser batch
+                            skills_queue.append(job_data)
+                        else:
+                            publish(job_data)
+                        new_jobs.append(job_data)
+                        await asyncio.to_thread(remember_job, history, job_data)
+                        stats["wuzzuf"]["scraped"] += 1
+
+                        if settle_keyword(state, len(new_jobs) >= target_jobs):
+                            revisit.append(state)
+                        break
+
+                    # Detail fetch failed - try the keyword's next card
+                    await submit_candidate(state)
+
+                apply_keyword_skips(stats, state)
+                await fill_queue()
+
+            for state in keyword_queue:
+                if state["future"] is not None:
+                    state["future"].cancel()
+
+            apply_leftover_skips(stats, keyword_states)
+
+            # Only jobs the static parse left without skills go through the browser, in one batch
+            await asyncio.to_thread(fill_skills_with_selenium, skills_queue, stats)
+            for job_data in skills_queue:
+                publish(job_data)
+
+        # Wait for Blogger posts and channel sends still in flight; a job whose
+        # publishing raised is dropped, as scrape_jobs would never have kept it
+        results = await asyncio.gather(*(task for _, task in publish_tasks), return_exceptions=True)
+        for (job, _), result in zip(publish_tasks, results):
+            if isinstance(result, Exception):
+                print(f"Error publishing {job['title']}: {result}")
+                new_jobs.remove(job)
+                await asyncio.to_thread(history.discard, job['link'])
+                stats["wuzzuf" if job.get("source") == "wuzzuf" else "indeed"]["scraped"] -= 1
+                count_skip(stats, "parse_error")
+
+    return await asyncio.to_thread(
+        finish_scrape, new_jobs, blog_posts_html, stats, history, start_time,
+        upload=upload, blogger_service=blogger_service, use_tinyurl=use_tinyurl, save_posts=save_posts)
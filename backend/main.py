@@ -4,6 +4,7 @@ from pydantic import BaseModel
 from typing import Optional, List
 import os
 import sys
+import asyncio
 import requests
 from dotenv import load_dotenv
 from supabase import create_client, Client
@@ -11,10 +12,14 @@ import logging
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path to import scraper
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from scraper import scrape_jobs
+from async_scraper import scrape_jobs_async
+from strategy_registry import get_registry
+from warmup import warm_up
 
 # Load environment variables
 load_dotenv()
@@ -42,6 +47,10 @@ API_SECRET_KEY = os.getenv("API_SECRET_KEY", "your-secret-key-here")
 # TinyURL API Key
 TINYURL_API_KEY = os.getenv("TINYURL_API_KEY", "nRFavNgCA9lwoqmk0BxuxBe1TXGTb4s97jR2os6Aq8TfxWAGXNoVlr1qLe2D")
 
+# Jobs per insert request when saving a run, and parallel TinyURL calls
+JOB_SAVE_BATCH_SIZE = int(os.getenv("JOB_SAVE_BATCH_SIZE", "50"))
+TINYURL_WORKERS = int(os.getenv("TINYURL_WORKERS", "8"))
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -247,6 +256,7 @@ class ScrapeRequest(BaseModel):
     send_to_whatsapp: bool = False
     use_tinyurl: bool = True
     use_selenium_skills: bool = False
+    async_engine: bool = False  # Run scrape_jobs_async on the event loop instead of a threadpool worker
 
 
 class ScrapeResponse(BaseModel):
@@ -414,8 +424,8 @@ async def start_scraping(
     verify_api_key(x_api_key)
     
     try:
-        # Add scraping task to background
-        background_tasks.add_task(run_scraper, request)
+        # Add scraping task to background (async tasks run on the event loop itself)
+        background_tasks.add_task(run_scraper_async if request.async_engine else run_scraper, request)
         
         # Log to Supabase
         log_data = {
@@ -485,6 +495,12 @@ async def get_stats():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/extraction-strategies")
+async def get_extraction_strategies():
+    """Hit rate of each extraction method per source/field (a falling rate means the page layout changed)"""
+    return get_registry().hit_rates()
+
+
 @app.get("/api/settings")
 async def get_settings():
     """Get all settings from database"""
@@ -547,243 +563,322 @@ async def get_logs(limit: int = 100, level: Optional[str] = None):
 
 
 # Background task function
+def log_scraper_start(config: ScrapeRequest):
+    """Write the start/configuration progress logs for a run"""
+    # Log start
+    supabase.table("scraping_logs").insert({
+        "level": "info",
+        "message": "🚀 Scraping started",
+        "metadata": config.dict()
+    }).execute()
+    
+    # Log configuration
+    sources_text = " and ".join(config.sources)
+    supabase.table("scraping_logs").insert({
+        "level": "info",
+        "message": f"📋 Configuration: Scraping {config.max_jobs} jobs from {sources_text}",
+        "metadata": {
+            "max_jobs": config.max_jobs,
+            "sources": config.sources,
+            "upload_to_blogger": config.upload_to_blogger,
+            "send_to_telegram": config.send_to_telegram,
+            "send_to_whatsapp": config.send_to_whatsapp
+        }
+    }).execute()
+    
+    # Log step 1
+    supabase.table("scraping_logs").insert({
+        "level": "info",
+        "message": "🔍 Step 1: Initializing web scraper...",
+        "metadata": {}
+    }).execute()
+    
+    # Log step 2
+    supabase.table("scraping_logs").insert({
+        "level": "info",
+        "message": "🌐 Step 2: Connecting to job sources...",
+        "metadata": {"sources": config.sources}
+    }).execute()
+    
+    # Log step 3
+    supabase.table("scraping_logs").insert({
+        "level": "info",
+        "message": "📊 Step 3: Extracting job listings...",
+        "metadata": {}
+    }).execute()
+
+
+def build_scrape_kwargs(config: ScrapeRequest) -> dict:
+    """Map a ScrapeRequest to scrape_jobs / scrape_jobs_async arguments"""
+    # Determine source parameters based on config
+    wuzzuf_only = "wuzzuf" in config.sources and "indeed" not in config.sources
+    indeed_only = "indeed" in config.sources and "wuzzuf" not in config.sources
+    include_indeed = "indeed" in config.sources
+    
+    logger.info(f"Calling scraper with: max_jobs={config.max_jobs}, wuzzuf_only={wuzzuf_only}, indeed_only={indeed_only}")
+    
+    return {
+        "upload": config.upload_to_blogger,
+        "save_posts": False,  # We'll save to Supabase instead
+        "use_selenium_skills": config.use_selenium_skills,
+        "send_whatsapp": config.send_to_whatsapp,
+        "send_telegram": config.send_to_telegram,
+        "max_jobs": config.max_jobs,
+        "include_indeed": include_indeed,
+        "wuzzuf_only": wuzzuf_only,
+        "indeed_only": indeed_only,
+        "use_tinyurl": config.use_tinyurl
+    }
+
+
+def log_scraper_error(scraper_error: Exception):
+    logger.error(f"Scraper function error: {scraper_error}")
+    supabase.table("scraping_logs").insert({
+        "level": "error",
+        "message": f"❌ Scraper error: {str(scraper_error)}",
+        "metadata": {"error": str(scraper_error), "type": type(scraper_error).__name__}
+    }).execute()
+
+
+def find_existing_job_links(links, batch_size=100):
+    """Links already in the jobs table - one `in_` query per batch_size links"""
+    links = list(dict.fromkeys(link for link in links if link))
+    existing = set()
+    for start in range(0, len(links), batch_size):
+        chunk = links[start:start + batch_size]
+        response = supabase.table("jobs").select("link").in_("link", chunk).execute()
+        existing.update(row["link"] for row in response.data)
+    return existing
+
+
+def build_job_record(job, tiny_url):
+    """Row for the jobs table from a scraped job"""
+    job_link = job.get("link", "")
+    
+    # Validate source - if invalid, try to detect from link
+    source = str(job.get("source", "")).lower().strip()
+    if source not in ["wuzzuf", "indeed"]:
+        if "indeed" in job_link.lower():
+            source = "indeed"
+        elif "wuzzuf" in job_link.lower():
+            source = "wuzzuf"
+        else:
+            source = "wuzzuf"  # Final fallback
+    
+    blogger_url = job.get("blog_link", "")  # scraper.py already sets this if uploaded
+    return {
+        "title": job.get("title", ""),
+        "company": job.get("company", ""),
+        "location": job.get("location", ""),
+        "salary": job.get("salary", "Confidential"),
+        "link": job_link,
+        "tiny_url": tiny_url,
+        "source": source,
+        "description": job.get("description", ""),
+        "requirements": job.get("requirements", []),
+        "skills": job.get("skills", []),
+        "slug": job.get("slug", ""),
+        "blogger_url": blogger_url,
+        "html_content": job.get("html_content", ""),
+        "posted_to_blogger": bool(blogger_url),  # True if blogger_url exists
+        "sent_to_telegram": job.get("sent_to_telegram", False),  # From scraper
+        "sent_to_whatsapp": job.get("sent_to_whatsapp", False),   # From scraper
+        "keyword": job.get("keyword", "")  # Add keyword
+    }
+
+
+def job_tiny_url(job):
+    """TinyURL of the Blogger post if there is one, otherwise of the job link"""
+    return create_tinyurl(job.get("blog_link") or job.get("link", ""))
+
+
+def insert_job_records(records):
+    """
+    Insert one batch of job rows in a single request. Rows whose link is already
+    in the table are ignored by the database (ON CONFLICT DO NOTHING), so only
+    rows actually inserted come back. Returns {link: id} for those rows.
+    """
+    response = supabase.table("jobs").upsert(records, on_conflict="link", ignore_duplicates=True).execute()
+    return {row["link"]: row["id"] for row in response.data}
+
+
+def save_scraper_result(config: ScrapeRequest, scraper_result):
+    """Save the scraped jobs to Supabase and log the run summary"""
+    # Extract jobs and stats from result
+    if isinstance(scraper_result, dict):
+        jobs_data = scraper_result.get("jobs", [])
+        scraper_stats = scraper_result.get("stats", {})
+    else:
+        # Backward compatibility: if scraper returns list directly
+        jobs_data = scraper_result
+        scraper_stats = {}
+    
+    # Log step 4
+    total_jobs = len(jobs_data) if jobs_data else 0
+    supabase.table("scraping_logs").insert({
+        "level": "info",
+        "message": f"✅ Step 4: Processing {total_jobs} job details...",
+        "metadata": {"total_jobs": total_jobs}
+    }).execute()
+    
+    # ============ SAVE JOBS TO SUPABASE ============
+    jobs_saved = 0
+    duplicate_links = []
+    if jobs_data and isinstance(jobs_data, list) and len(jobs_data) > 0:
+        total_jobs = len(jobs_data)
+        logger.info(f"Found {total_jobs} jobs, saving to database...")
+        
+        # One job per link, and no TinyURL calls for jobs the table already has
+        # (the insert below ignores them anyway; this only saves API calls)
+        jobs_by_link = {job.get("link", ""): job for job in jobs_data if job.get("link")}
+        existing_links = find_existing_job_links(jobs_by_link)
+        new_jobs = [job for link, job in jobs_by_link.items() if link not in existing_links]
+        with ThreadPoolExecutor(max_workers=TINYURL_WORKERS) as executor:
+            tiny_urls = list(executor.map(job_tiny_url, new_jobs))
+        records = [build_job_record(job, tiny_url) for job, tiny_url in zip(new_jobs, tiny_urls)]
+        
+        inserted = {}
+        duplicate_links = [link for link in jobs_by_link if link in existing_links]
+        for start in range(0, len(records), JOB_SAVE_BATCH_SIZE):
+            batch = records[start:start + JOB_SAVE_BATCH_SIZE]
+            done = min(start + len(batch), len(records))
+            progress_percent = int(done / len(records) * 100)
+            try:
+                batch_ids = insert_job_records(batch)
+                inserted.update(batch_ids)
+                # Rows the insert ignored were added by someone else since the lookup
+                duplicate_links += [record["link"] for record in batch if record["link"] not in batch_ids]
+                jobs_saved = len(inserted)
+                logger.info(f"Saved {jobs_saved}/{len(records)} new jobs")
+                supabase.table("scraping_logs").insert({
+                    "level": "info",
+                    "message": f"💾 Saved jobs {start + 1}-{done}/{len(records)} ({progress_percent}%): {len(batch_ids)} new",
+                    "metadata": {
+                        "progress": progress_percent,
+                        "current": done,
+                        "total": len(records),
+                        "inserted_ids": list(batch_ids.values())
+                    }
+                }).execute()
+            except Exception as e:
+                logger.error(f"Error saving jobs to database: {e}")
+                supabase.table("scraping_logs").insert({
+                    "level": "warning",
+                    "message": f"⚠️ Could not save {len(batch)} jobs",
+                    "metadata": {"error": str(e), "titles": [record["title"] for record in batch]}
+                }).execute()
+            
+            # Check if stop signal received
+            if STOP_SCRAPING:
+                logger.info("Stop signal detected, breaking loop")
+                supabase.table("scraping_logs").insert({
+                    "level": "warning",
+                    "message": f"⛔ Scraping stopped by user after {jobs_saved} jobs",
+                    "metadata": {"jobs_saved": jobs_saved}
+                }).execute()
+                break
+        
+        # One summary entry for the duplicates instead of one per job
+        if duplicate_links:
+            logger.info(f"⏭️ Skipped {len(duplicate_links)} duplicate jobs")
+            supabase.table("scraping_logs").insert({
+                "level": "info",
+                "message": f"⏭️ Skipped {len(duplicate_links)} duplicates",
+                "metadata": {"links": duplicate_links, "reason": "duplicate"}
+            }).execute()
+    else:
+        logger.warning(f"No jobs returned from scraper. jobs_data type: {type(jobs_data)}, value: {jobs_data}")
+        supabase.table("scraping_logs").insert({
+            "level": "warning",
+            "message": "⚠️ Scraper returned no jobs",
+            "metadata": {"jobs_data_type": str(type(jobs_data)), "is_none": jobs_data is None}
+        }).execute()
+    
+    # Log completion
+    total_scraped = len(jobs_data) if jobs_data else 0
+    duplicates_skipped = len(duplicate_links)
+    
+    completion_message = f"🎉 Scraping completed! Saved {jobs_saved} new jobs"
+    if duplicates_skipped > 0:
+        completion_message += f" (skipped {duplicates_skipped} duplicates)"
+    
+    supabase.table("scraping_logs").insert({
+        "level": "info",
+        "message": completion_message,
+        "metadata": {
+            "status": "completed", 
+            "jobs_saved": jobs_saved,
+            "duplicates_skipped": duplicates_skipped,
+            "total_scraped": total_scraped,
+            "sources": config.sources,
+            "skip_reasons": scraper_stats.get("skip_reasons", {}),
+            "wuzzuf_stats": scraper_stats.get("wuzzuf", {}),
+            "indeed_stats": scraper_stats.get("indeed", {})
+        }
+    }).execute()
+    
+    logger.info(f"Scraping completed - {jobs_saved} new jobs saved, {duplicates_skipped} duplicates skipped")
+
+
 def run_scraper(config: ScrapeRequest):
     """
     Run the scraper with given configuration
     This will be implemented to call scraper.py
     """
+    global SCRAPING_ACTIVE, STOP_SCRAPING
     logger.info(f"Starting scraper with config: {config}")
     
     try:
-        # Log start
-        supabase.table("scraping_logs").insert({
-            "level": "info",
-            "message": "🚀 Scraping started",
-            "metadata": config.dict()
-        }).execute()
-        
-        # Log configuration
-        sources_text = " and ".join(config.sources)
-        supabase.table("scraping_logs").insert({
-            "level": "info",
-            "message": f"📋 Configuration: Scraping {config.max_jobs} jobs from {sources_text}",
-            "metadata": {
-                "max_jobs": config.max_jobs,
-                "sources": config.sources,
-                "upload_to_blogger": config.upload_to_blogger,
-                "send_to_telegram": config.send_to_telegram,
-                "send_to_whatsapp": config.send_to_whatsapp
-            }
-        }).execute()
-        
-        # Log step 1
-        supabase.table("scraping_logs").insert({
-            "level": "info",
-            "message": "🔍 Step 1: Initializing web scraper...",
-            "metadata": {}
-        }).execute()
-        
-        # Log step 2
-        supabase.table("scraping_logs").insert({
-            "level": "info",
-            "message": "🌐 Step 2: Connecting to job sources...",
-            "metadata": {"sources": config.sources}
-        }).execute()
+        log_scraper_start(config)
         
         # ============ CALL ACTUAL SCRAPER ============
-        # Determine source parameters based on config
-        wuzzuf_only = "wuzzuf" in config.sources and "indeed" not in config.sources
-        indeed_only = "indeed" in config.sources and "wuzzuf" not in config.sources
-        include_indeed = "indeed" in config.sources
-        
-        # Log step 3
-        supabase.table("scraping_logs").insert({
-            "level": "info",
-            "message": "📊 Step 3: Extracting job listings...",
-            "metadata": {}
-        }).execute()
-        
-        # Run the actual scraper
-        logger.info(f"Calling scrape_jobs with: max_jobs={config.max_jobs}, wuzzuf_only={wuzzuf_only}, indeed_only={indeed_only}")
-        
         try:
-            scraper_result = scrape_jobs(
-                upload=config.upload_to_blogger,
-                save_posts=False,  # We'll save to Supabase instead
-                use_selenium_skills=config.use_selenium_skills,
-                send_whatsapp=config.send_to_whatsapp,
-                send_telegram=config.send_to_telegram,
-                max_jobs=config.max_jobs,
-                include_indeed=include_indeed,
-                wuzzuf_only=wuzzuf_only,
-                indeed_only=indeed_only,
-                use_tinyurl=config.use_tinyurl
-            )
-            
-            # Extract jobs and stats from result
-            if isinstance(scraper_result, dict):
-                jobs_data = scraper_result.get("jobs", [])
-                scraper_stats = scraper_result.get("stats", {})
-            else:
-                # Backward compatibility: if scraper returns list directly
-                jobs_data = scraper_result
-                scraper_stats = {}
-                
+            scraper_result = scrape_jobs(**build_scrape_kwargs(config))
         except Exception as scraper_error:
-            logger.error(f"Scraper function error: {scraper_error}")
-            supabase.table("scraping_logs").insert({
-                "level": "error",
-                "message": f"❌ Scraper error: {str(scraper_error)}",
-                "metadata": {"error": str(scraper_error), "type": type(scraper_error).__name__}
-            }).execute()
+            log_scraper_error(scraper_error)
             raise
         
-        # Log step 4
-        total_jobs = len(jobs_data) if jobs_data else 0
-        supabase.table("scraping_logs").insert({
-            "level": "info",
-            "message": f"✅ Step 4: Processing {total_jobs} job details...",
-            "metadata": {"total_jobs": total_jobs}
-        }).execute()
-        
-        # ============ SAVE JOBS TO SUPABASE ============
-        jobs_saved = 0
-        if jobs_data and isinstance(jobs_data, list) and len(jobs_data) > 0:
-            global STOP_SCRAPING
-            total_jobs = len(jobs_data)
-            logger.info(f"Found {total_jobs} jobs, saving to database...")
-            
-            for idx, job in enumerate(jobs_data, 1):
-                try:
-                    # Check if job already exists (duplicate check)
-                    job_link = job.get("link", "")
-                    existing_job = supabase.table("jobs").select("id").eq("link", job_link).execute()
-                    
-                    if existing_job.data and len(existing_job.data) > 0:
-                        # Job already exists, skip it
-                        logger.info(f"⏭️ Skipping duplicate job: {job.get('title', 'Unknown')}")
-                        supabase.table("scraping_logs").insert({
-                            "level": "info",
-                            "message": f"⏭️ Skipped duplicate: {job.get('title', 'Unknown')}",
-                            "metadata": {"link": job_link, "reason": "duplicate"}
-                        }).execute()
-                        continue  # Skip to next job
-                    
-                    # Log progress
-                    progress_percent = int((idx / total_jobs) * 100)
-                    supabase.table("scraping_logs").insert({
-                        "level": "info",
-                        "message": f"💾 Saving job {idx}/{total_jobs} ({progress_percent}%): {job.get('title', 'Unknown')}",
-                        "metadata": {
-                            "progress": progress_percent,
-                            "current": idx,
-                            "total": total_jobs
-                        }
-                    }).execute()
-                    # Get source and validate
-                    source = str(job.get("source", "")).lower().strip()
-                    
-                    # Validate source - if invalid, try to detect from link
-                    if source not in ["wuzzuf", "indeed"]:
-                        if "indeed" in job_link.lower():
-                            source = "indeed"
-                        elif "wuzzuf" in job_link.lower():
-                            source = "wuzzuf"
-                        else:
-                            source = "wuzzuf"  # Final fallback
-                    
-                    # Create TinyURL for the link (if not blogger)
-                    blogger_url = job.get("blog_link", "")  # scraper.py already sets this if uploaded
-                    
-                    # Use blogger URL with TinyURL if available, otherwise create TinyURL for job link
-                    if blogger_url:
-                        tiny_url = create_tinyurl(blogger_url)
-                    else:
-                        tiny_url = create_tinyurl(job_link)
-                    
-                    # Prepare job data for Supabase
-                    job_record = {
-                        "title": job.get("title", ""),
-                        "company": job.get("company", ""),
-                        "location": job.get("location", ""),
-                        "salary": job.get("salary", "Confidential"),
-                        "link": job_link,
-                        "tiny_url": tiny_url,
-                        "source": source,
-                        "description": job.get("description", ""),
-                        "requirements": job.get("requirements", []),
-                        "skills": job.get("skills", []),
-                        "slug": job.get("slug", ""),
-                        "blogger_url": blogger_url,
-                        "html_content": job.get("html_content", ""),
-                        "posted_to_blogger": bool(blogger_url),  # True if blogger_url exists
-                        "sent_to_telegram": job.get("sent_to_telegram", False),  # From scraper
-                        "sent_to_whatsapp": job.get("sent_to_whatsapp", False),   # From scraper
-                        "keyword": job.get("keyword", "")  # Add keyword
-                    }
-                    
-                    # Insert into Supabase
-                    result = supabase.table("jobs").insert(job_record).execute()
-                    jobs_saved += 1
-                    logger.info(f"Saved job: {job.get('title')} from {source}")
-                    
-                    # Check if stop signal received
-                    if STOP_SCRAPING:
-                        logger.info("Stop signal detected, breaking loop")
-                        supabase.table("scraping_logs").insert({
-                            "level": "warning",
-                            "message": f"⛔ Scraping stopped by user after {jobs_saved} jobs",
-                            "metadata": {"jobs_saved": jobs_saved}
-                        }).execute()
-                        break
-                    
-                except Exception as e:
-                    logger.error(f"Error saving job to database: {e}")
-                    supabase.table("scraping_logs").insert({
-                        "level": "warning",
-                        "message": f"⚠️ Could not save job: {job.get('title', 'Unknown')}",
-                        "metadata": {"error": str(e)}
-                    }).execute()
-        else:
-            logger.warning(f"No jobs returned from scraper. jobs_data type: {type(jobs_data)}, value: {jobs_data}")
-            supabase.table("scraping_logs").insert({
-                "level": "warning",
-                "message": "⚠️ Scraper returned no jobs",
-                "metadata": {"jobs_data_type": str(type(jobs_data)), "is_none": jobs_data is None}
-            }).execute()
-        
-        # Log completion
-        total_scraped = len(jobs_data) if jobs_data else 0
-        duplicates_skipped = total_scraped - jobs_saved
-        
-        completion_message = f"🎉 Scraping completed! Saved {jobs_saved} new jobs"
-        if duplicates_skipped > 0:
-            completion_message += f" (skipped {duplicates_skipped} duplicates)"
+        save_scraper_result(config, scraper_result)
         
+    except Exception as e:
+        logger.error(f"Scraper error: {e}")
         supabase.table("scraping_logs").insert({
-            "level": "info",
-            "message": completion_message,
-            "metadata": {
-                "status": "completed", 
-                "jobs_saved": jobs_saved,
-                "duplicates_skipped": duplicates_skipped,
-                "total_scraped": total_scraped,
-                "sources": config.sources,
-                "skip_reasons": scraper_stats.get("skip_reasons", {}),
-                "wuzzuf_stats": scraper_stats.get("wuzzuf", {}),
-                "indeed_stats": scraper_stats.get("indeed", {})
-            }
+            "level": "error",
+            "message": f"❌ Scraping failed: {str(e)}",
+            "metadata": {"error": str(e), "type": type(e).__name__}
         }).execute()
+    
+    finally:
+        SCRAPING_ACTIVE = False
+        STOP_SCRAPING = False
+
+
+async def run_scraper_async(config: ScrapeRequest):
+    """
+    Async variant of run_scraper: awaits scrape_jobs_async on the event loop,
+    while the blocking Supabase logging/saving runs in a worker thread
+    """
+    global SCRAPING_ACTIVE, STOP_SCRAPING
+    logger.info(f"Starting async scraper with config: {config}")
+    
+    try:
+        await asyncio.to_thread(log_scraper_start, config)
+        
+        try:
+            scraper_result = await scrape_jobs_async(**build_scrape_kwargs(config))
+        except Exception as scraper_error:
+            await asyncio.to_thread(log_scraper_error, scraper_error)
+            raise
         
-        logger.info(f"Scraping completed - {jobs_saved} new jobs saved, {duplicates_skipped} duplicates skipped")
+        await asyncio.to_thread(save_scraper_result, config, scraper_result)
         
     except Exception as e:
         logger.error(f"Scraper error: {e}")
-        supabase.table("scraping_logs").insert({
+        await asyncio.to_thread(lambda: supabase.table("scraping_logs").insert({
             "level": "error",
             "message": f"❌ Scraping failed: {str(e)}",
             "metadata": {"error": str(e), "type": type(e).__name__}
-        }).execute()
+        }).execute())
     
     finally:
         SCRAPING_ACTIVE = False
@@ -1047,9 +1142,28 @@ if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
 
 
+def log_warmup_result(task):
+    """Done-callback for the startup warmup task: surface failures in the log"""
+    if task.cancelled():
+        logger.warning("Startup warmup was cancelled")
+    elif task.exception() is not None:
+        logger.error(f"Startup warmup failed: {task.exception()}")
+    else:
+        logger.info("Startup warmup finished")
+
+
 @app.on_event("startup")
 async def startup_event():
     """تحميل schedule عند بدء الخادم"""
     logger.info("Loading schedule on startup...")
     update_schedule_job()
     logger.info("Schedule loaded")
+    
+    # Pre-warm browser, Blogger and HTTP pools in the background so /api/scrape starts immediately
+    # (read here, after load_dotenv, rather than at import time)
+    if os.getenv("WARMUP_ON_STARTUP", "0") == "1":
+        logger.info("Pre-warming scraping runtime in the background...")
+        # Keep a reference so the task is not garbage-collected mid-warmup
+        app.state.warmup_task = asyncio.create_task(asyncio.to_thread(warm_up))
+        app.state.warmup_task.add_done_callback(log_warmup_result)
+
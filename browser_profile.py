@@ -0,0 +1,95 @@
+"""
+Headless Chrome profile for TechFlow scraper
+We only read page_source, so images, fonts, stylesheets, media, analytics and
+ads are never downloaded: images through Chrome preferences, the rest through
+DevTools URL blocking. DevTools patterns cannot exempt a host from the extension
+patterns, so BROWSER_ALLOWLIST works per pattern: list "*.css" to keep every
+stylesheet, or a tracker host to keep that host. Indeed's browsers run unblocked
+(INDEED_BLOCK_RESOURCES=0) because Cloudflare's challenge needs its assets.
+"""
+import os
+
+try:
+    from selenium.webdriver.chrome.options import Options
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    SELENIUM_AVAILABLE = False
+
+# Set BROWSER_BLOCK_RESOURCES=0 to load pages with everything
+BROWSER_BLOCK_RESOURCES = os.getenv("BROWSER_BLOCK_RESOURCES", "1") == "1"
+# Indeed/Cloudflare pool: off by default, the challenge page must load in full
+INDEED_BLOCK_RESOURCES = os.getenv("INDEED_BLOCK_RESOURCES", "0") == "1"
+# Comma-separated block patterns (e.g. *.css) or tracker hosts that must not be blocked
+BROWSER_ALLOWLIST = [p.strip() for p in os.getenv("BROWSER_ALLOWLIST", "").split(",") if p.strip()]
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Resource types by file extension (DevTools wildcard patterns)
+BLOCKED_EXTENSIONS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.avif",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.css",
+    "*.mp4", "*.webm", "*.mp3",
+]
+
+# Analytics, ads and tag managers seen on Wuzzuf and Indeed
+TRACKER_HOSTS = [
+    "google-analytics.com", "googletagmanager.com", "googlesyndication.com",
+    "doubleclick.net", "googleadservices.com", "adservice.google.com",
+    "facebook.net", "connect.facebook.net", "hotjar.com", "clarity.ms",
+    "segment.io", "segment.com", "amplitude.com", "mixpanel.com",
+    "newrelic.com", "nr-data.net", "bat.bing.com", "snap.licdn.com",
+    "tiktok.com", "analytics.twitter.com",
+]
+
+
+def is_allowed(pattern, allowlist=None):
+    """
+    True when an allowlist entry is the pattern itself, or a host that the
+    host pattern ("*host*") covers (the host or one of its subdomains)
+    """
+    allowlist = BROWSER_ALLOWLIST if allowlist is None else allowlist
+    host = pattern.strip("*") if pattern.startswith("*") and pattern.endswith("*") else None
+    return any(allowed == pattern or (host and (host == allowed or host.endswith("." + allowed)))
+               for allowed in allowlist)
+
+
+def blocked_url_patterns(allowlist=None):
+    """DevTools Network.setBlockedURLs patterns, minus anything the allowlist names"""
+    patterns = BLOCKED_EXTENSIONS + [f"*{host}*" for host in TRACKER_HOSTS]
+    return [pattern for pattern in patterns if not is_allowed(pattern, allowlist)]
+
+
+def build_chrome_options(block_resources=BROWSER_BLOCK_RESOURCES, allowlist=None):
+    """Headless Chrome options shared by every Selenium session"""
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument(f"--user-agent={USER_AGENT}")
+    if block_resources:
+        # Images never leave the network layer when the content setting blocks them
+        if not is_allowed("*.png", allowlist):
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+            })
+        options.add_argument("--mute-audio")
+        options.add_argument("--disable-background-networking")
+    return options
+
+
+def apply_request_blocking(driver, block_resources=BROWSER_BLOCK_RESOURCES, allowlist=None):
+    """Install the URL block list on a started driver (DevTools; skipped if unsupported)"""
+    if not block_resources:
+        return False
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_url_patterns(allowlist)})
+        return True
+    except Exception as e:
+        print(f"⚠️  Could not enable request blocking: {e}")
+        return False
@@ -0,0 +1,109 @@
+"""
+Sampled debug HTML capture for TechFlow scraper
+Off by default. When enabled, keeps the raw page source of every Nth page
+and/or of pages whose extraction failed, gzip-compressed and written on a
+background thread, in a ring buffer of the most recent DEBUG_CAPTURE_KEEP files.
+"""
+import os
+import re
+import gzip
+import time
+import queue
+import threading
+import itertools
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Capture 1 in N pages (0 = no sampling) and/or every failed extraction
+DEBUG_CAPTURE_EVERY = int(os.getenv("DEBUG_CAPTURE_EVERY", "0"))
+DEBUG_CAPTURE_FAILURES = os.getenv("DEBUG_CAPTURE_FAILURES", "0") == "1"
+DEBUG_CAPTURE_KEEP = int(os.getenv("DEBUG_CAPTURE_KEEP", "20"))
+DEBUG_CAPTURE_DIR = os.getenv("DEBUG_CAPTURE_DIR", os.path.join(SCRIPT_DIR, "debug_captures"))
+
+_pages = itertools.count(1)  # Pages seen in this run (reset_page_count() at run start)
+_queue = queue.Queue(maxsize=32)
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def capture_enabled():
+    return DEBUG_CAPTURE_EVERY > 0 or DEBUG_CAPTURE_FAILURES
+
+
+def should_capture(page, failed=False):
+    """Keep page number `page` of this run?"""
+    if failed and DEBUG_CAPTURE_FAILURES:
+        return True
+    return DEBUG_CAPTURE_EVERY > 0 and page % DEBUG_CAPTURE_EVERY == 0
+
+
+def reset_page_count():
+    """Start sampling afresh (the backend process outlives runs)"""
+    global _pages
+    _pages = itertools.count(1)
+
+
+def capture(source, html, url="", failed=False):
+    """
+    Queue a page for the background writer. Never blocks the scraper: when the
+    queue is full the page is dropped.
+    """
+    if not capture_enabled():
+        return
+    page = next(_pages)
+    if not should_capture(page, failed):
+        return
+    _start_writer()
+    try:
+        _queue.put_nowait((source, html, url, failed, page, time.time()))
+    except queue.Full:
+        pass
+
+
+def capture_path(source, url, failed, page, timestamp):
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", url.split("//")[-1])[-60:].strip("-") or "page"
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(timestamp))
+    status = "failed" if failed else "sample"
+    # Timestamp + page number first, so sorting by name is oldest first
+    return os.path.join(DEBUG_CAPTURE_DIR, f"{stamp}-{page:05d}_{source}_{status}_{slug}.html.gz")
+
+
+def prune(keep=None):
+    """Drop the oldest captures beyond the ring buffer size"""
+    keep = DEBUG_CAPTURE_KEEP if keep is None else keep
+    files = sorted(name for name in os.listdir(DEBUG_CAPTURE_DIR) if name.endswith(".html.gz"))
+    for name in files[:max(0, len(files) - keep)]:
+        try:
+            os.remove(os.path.join(DEBUG_CAPTURE_DIR, name))
+        except OSError:
+            pass
+
+
+def _write_loop():
+    while True:
+        source, html, url, failed, page, timestamp = _queue.get()
+        try:
+            os.makedirs(DEBUG_CAPTURE_DIR, exist_ok=True)
+            data = html.encode("utf-8") if isinstance(html, str) else html
+            with gzip.open(capture_path(source, url, failed, page, timestamp), "wb", compresslevel=6) as f:
+                f.write(data)
+            prune()
+        except OSError as e:
+            print(f"⚠️  Could not write debug capture: {e}")
+        finally:
+            _queue.task_done()
+
+
+def _start_writer():
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = threading.Thread(target=_write_loop, name="debug-capture", daemon=True)
+                _writer.start()
+
+
+def flush():
+    """Wait until queued captures are on disk (end of run)"""
+    if _writer is not None:
+        _queue.join()
@@ -0,0 +1,374 @@
+"""
+Warm headless Chrome pool for TechFlow scraper
+Keeps started drivers around between jobs instead of paying Chrome startup
+(1-3 s, a few hundred MB) for every Selenium call. Drivers are health-checked
+before each lease and restarted after DRIVER_MAX_PAGES page loads, or when the
+chromedriver/Chrome process tree grows past DRIVER_MAX_RSS_MB.
+
+    with get_pool().lease() as driver:
+        driver.get(url)
+"""
+import os
+import time
+import atexit
+import threading
+from contextlib import contextmanager
+
+try:
+    from selenium import webdriver
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    SELENIUM_AVAILABLE = False
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+try:
+    import undetected_chromedriver as uc
+    UNDETECTED_AVAILABLE = True
+except ImportError:
+    UNDETECTED_AVAILABLE = False
+
+from browser_profile import build_chrome_options, apply_request_blocking, INDEED_BLOCK_RESOURCES
+
+# Drivers kept per pool kind, and page loads before a driver is replaced
+DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "2"))
+DRIVER_MAX_PAGES = int(os.getenv("DRIVER_MAX_PAGES", "50"))
+# Restart a driver once its process tree (chromedriver + Chrome + renderers) uses this much memory
+DRIVER_MAX_RSS_MB = float(os.getenv("DRIVER_MAX_RSS_MB", "1200"))
+
+
+def start_standard_driver():
+    driver = webdriver.Chrome(options=build_chrome_options())
+    apply_request_blocking(driver)
+    return driver
+
+
+def start_indeed_driver():
+    """
+    undetected_chromedriver gets past Indeed's Cloudflare check; plain Chrome otherwise.
+    Resources stay unblocked unless INDEED_BLOCK_RESOURCES=1 (the challenge needs them).
+    """
+    options = build_chrome_options(block_resources=INDEED_BLOCK_RESOURCES)
+    if UNDETECTED_AVAILABLE:
+        driver = uc.Chrome(options=options, use_subprocess=True)
+    else:
+        driver = webdriver.Chrome(options=options)
+    apply_request_blocking(driver, block_resources=INDEED_BLOCK_RESOURCES)
+    return driver
+
+
+DRIVER_FACTORIES = {
+    "standard": start_standard_driver,
+    "indeed": start_indeed_driver,
+}
+
+
+def quit_driver(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass  # Ignore any cleanup errors
+
+
+def _children_from_proc(pid):
+    children = []
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children") as f:
+                children.extend(int(child) for child in f.read().split())
+    except OSError:
+        pass
+    return children
+
+
+def _rss_from_proc(pid):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def process_tree_rss(pids):
+    """Resident memory (bytes) of the given processes and all their descendants; None if unknown"""
+    seen = set()
+    stack = [pid for pid in pids if pid]
+    total = 0
+    while stack:
+        pid = stack.pop()
+        if pid in seen:
+            continue
+        seen.add(pid)
+        if PSUTIL_AVAILABLE:
+            try:
+                process = psutil.Process(pid)
+                total += process.memory_info().rss
+                stack.extend(child.pid for child in process.children())
+            except psutil.Error:
+                pass
+        else:
+            total += _rss_from_proc(pid)
+            stack.extend(_children_from_proc(pid))
+    if not seen or (not PSUTIL_AVAILABLE and not os.path.isdir("/proc")):
+        return None
+    return total
+
+
+def driver_pids(driver):
+    """chromedriver pid plus the browser pid (uc.Chrome starts Chrome outside chromedriver)"""
+    pids = []
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    if process is not None:
+        pids.append(process.pid)
+    browser_pid = getattr(driver, "browser_pid", None)
+    if browser_pid:
+        pids.append(browser_pid)
+    return pids
+
+
+def driver_rss_mb(driver):
+    rss = process_tree_rss(driver_pids(driver))
+    return None if rss is None else rss / (1024 * 1024)
+
+
+def driver_is_healthy(driver):
+    """A cheap round trip to the browser; a dead session or crashed Chrome raises"""
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+
+class DriverPool:
+    """
+    Up to `size` drivers of one kind. lease() hands out an idle driver (starting
+    one when none is idle and the pool is not full, otherwise waiting for a return).
+    """
+
+    def __init__(self, factory, size=DRIVER_POOL_SIZE, max_pages=DRIVER_MAX_PAGES,
+                 max_rss_mb=DRIVER_MAX_RSS_MB, name="standard"):
+        self.factory = factory
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.name = name
+        self._idle = []  # Most recently returned last, so the warmest driver is reused first
+        self._idle_since = {}  # id(driver) -> time it was returned
+        self._pages = {}  # id(driver) -> page loads since start
+        self._leased = set()  # id(driver) of drivers currently handed out
+        self._started = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Start counting afresh (each run reports its own restarts and peak memory)"""
+        self.stats = {"started": 0, "reused": 0, "recycled": 0, "unhealthy": 0,
+                      "memory_restarts": 0, "peak_rss_mb": 0}
+
+    def _start(self):
+        driver = self.factory()
+        with self._cond:
+            self._pages[id(driver)] = 0
+            self.stats["started"] += 1
+        return driver
+
+    def _discard(self, driver):
+        quit_driver(driver)
+        with self._cond:
+            self._pages.pop(id(driver), None)
+            self._started -= 1
+            self._cond.notify()
+
+    def acquire(self):
+        """Take a healthy driver out of the pool (blocks while all `size` drivers are leased)"""
+        while True:
+            with self._cond:
+                while not self._idle and self._started >= self.size:
+                    self._cond.wait()
+                if self._idle:
+                    driver = self._idle.pop()
+                    self._idle_since.pop(id(driver), None)
+                else:
+                    driver = None
+                    self._started += 1
+
+            if driver is None:
+                try:
+                    driver = self._start()
+                except Exception:
+                    with self._cond:
+                        self._started -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._leased.add(id(driver))
+                return driver
+
+            if driver_is_healthy(driver):
+                with self._cond:
+                    self.stats["reused"] += 1
+                    self._leased.add(id(driver))
+                return driver
+            print(f"⚠️  Replacing unhealthy {self.name} driver")
+            with self._cond:
+                self.stats["unhealthy"] += 1
+            self._discard(driver)
+
+    def count_page(self, driver, pages=1):
+        """Record page loads for a long lease (lease() itself counts one)"""
+        with self._cond:
+            if id(driver) in self._pages:
+                self._pages[id(driver)] += pages
+
+    def restart_reason(self, driver):
+        """Why a driver should be replaced now ("pages" / "memory" / "dead"), or None"""
+        with self._cond:
+            pages = self._pages.get(id(driver), 0)
+        if pages >= self.max_pages:
+            return "pages"
+        rss_mb = driver_rss_mb(driver)
+        if rss_mb is not None:
+            with self._cond:
+                self.stats["peak_rss_mb"] = max(self.stats["peak_rss_mb"], round(rss_mb))
+            if rss_mb >= self.max_rss_mb:
+                return "memory"
+        if not driver_is_healthy(driver):
+            return "dead"
+        return None
+
+    def release(self, driver, broken=False):
+        """Return a leased driver; broken, worn-out or bloated drivers are quit instead of kept"""
+        reason = "dead" if broken else self.restart_reason(driver)
+        with self._cond:
+            if id(driver) not in self._leased:
+                return  # Already returned
+            self._leased.discard(id(driver))
+            keep = reason is None and not self._closed
+            if keep:
+                self._idle.append(driver)
+                self._idle_since[id(driver)] = time.time()
+                self._cond.notify()
+            else:
+                self._count_restart(reason)
+        if not keep:
+            self._discard(driver)
+
+    def _count_restart(self, reason):
+        if reason == "pages":
+            self.stats["recycled"] += 1
+        elif reason == "memory":
+            self.stats["memory_restarts"] += 1
+        elif reason == "dead":
+            self.stats["unhealthy"] += 1
+
+    def renew(self, driver):
+        """
+        For long leases: between pages, swap a driver that is worn out, over the
+        memory limit or dead for a fresh one (same lease, new browser)
+        """
+        reason = self.restart_reason(driver)
+        if reason is None:
+            return driver
+        print(f"🔄 Restarting {self.name} browser ({reason})")
+        self.release(driver, broken=reason == "dead")
+        return self.acquire()
+
+    @contextmanager
+    def lease(self):
+        driver = self.acquire()
+        self.count_page(driver)
+        broken = False
+        try:
+            yield driver
+        except Exception:
+            broken = not driver_is_healthy(driver)
+            raise
+        finally:
+            self.release(driver, broken=broken)
+
+    def warm(self, count=1):
+        """Start drivers ahead of time so the next leases skip Chrome startup"""
+        drivers = []
+        try:
+            for _ in range(min(count, self.size)):
+                drivers.append(self.acquire())
+        finally:
+            for driver in drivers:
+                self.release(driver)
+        return len(drivers)
+
+    def close_idle(self, max_idle):
+        """Quit drivers that have sat unused for more than max_idle seconds"""
+        cutoff = time.time() - max_idle
+        with self._cond:
+            stale = [driver for driver in self._idle if self._idle_since.get(id(driver), 0) < cutoff]
+            self._idle = [driver for driver in self._idle if driver not in stale]
+            for driver in stale:
+                self._idle_since.pop(id(driver), None)
+        for driver in stale:
+            self._discard(driver)
+        return len(stale)
+
+    def close(self):
+        """Quit every idle driver; drivers still leased are quit when they come back"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._idle_since.clear()
+        for driver in idle:
+            self._discard(driver)
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(kind="standard"):
+    """Return the process-wide pool for a driver kind ("standard" or "indeed")"""
+    with _pools_lock:
+        if kind not in _pools:
+            _pools[kind] = DriverPool(DRIVER_FACTORIES[kind], name=kind)
+        return _pools[kind]
+
+
+def pool_stats():
+    """{kind: stats} since the last reset_pool_stats() (run summary / log metadata)"""
+    with _pools_lock:
+        return {kind: dict(pool.stats) for kind, pool in _pools.items()}
+
+
+def reset_pool_stats():
+    """Zero every pool's counters at the start of a run (pools outlive runs in the backend)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        with pool._cond:
+            pool.reset_stats()
+
+
+def close_idle_drivers(max_idle):
+    """Quit idle drivers older than max_idle seconds in every pool"""
+    with _pools_lock:
+        pools = list(_pools.values())
+    return sum(pool.close_idle(max_idle) for pool in pools)
+
+
+def close_pools():
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_pools)
@@ -0,0 +1,458 @@
+"""
+Single-pass job page extraction for TechFlow scraper
+Parses a Wuzzuf job page once with lxml, indexes headings, lists, links and images
+in one traversal, and answers the same questions as scraper.extract_job_details()
+(salary, description, requirements, skills, logo) from that index.
+
+Every lookup mirrors the BeautifulSoup call it replaces (find_next_sibling,
+find_parent, find, find_all_next, get_text(strip=True), ...), so the output is
+the same as the html.parser path for the same page.
+"""
+from bisect import bisect_right
+
+from lxml import etree, html as lxml_html
+
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5')
+
+# Content of these tags is not part of a parent's get_text() in BeautifulSoup
+RAW_TEXT_TAGS = ('script', 'style', 'template', 'rt', 'rp')
+
+SALARY_INDICATORS = ["EGP", "SAR", "AED", "USD", "KWD", "QAR", "OMR", "BHD", "JOD"]
+CURRENCY_SYMBOLS = ["E£", "£", "$", "﷼"]
+
+
+class PageIndex:
+    """
+    Document-order index of a parsed page.
+    Elements are numbered in document order; a subtree is the range
+    position[el]..end[el], so descendant lookups are a bisect into a per-tag list.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.elements = []      # every element, document order
+        self.position = {}      # element -> index in self.elements
+        self.end = {}           # element -> index of its last descendant
+        self.by_tag = {}        # tag -> [indexes], ascending
+        self.strings = []       # (text, parent element) for every text/comment node, document order
+        self._text = {}
+        self._raw_text = {}
+        self._add(root, None)
+
+    def _add(self, el, parent):
+        if isinstance(el.tag, str):
+            index = len(self.elements)
+            self.elements.append(el)
+            self.position[el] = index
+            self.by_tag.setdefault(el.tag, []).append(index)
+            if el.text:
+                self.strings.append((el.text, el))
+            for child in el:
+                self._add(child, el)
+            self.end[el] = len(self.elements) - 1
+        elif isinstance(el, etree._Comment) and el.text:
+            self.strings.append((el.text, parent))
+
+        if el.tail and parent is not None:
+            self.strings.append((el.tail, parent))
+
+    # ---- tree navigation (BeautifulSoup equivalents) ----
+
+    def parent(self, el):
+        """Tag.find_parent() - the whole document stands in for the BeautifulSoup object"""
+        return el.getparent() if el.getparent() is not None else self.root
+
+    def next_sibling(self, el):
+        """Tag.find_next_sibling() - skips comments"""
+        sibling = el.getnext()
+        while sibling is not None and not isinstance(sibling.tag, str):
+            sibling = sibling.getnext()
+        return sibling
+
+    def find(self, el, tag):
+        """Tag.find(tag) - first descendant with that tag"""
+        indexes = self.by_tag.get(tag, [])
+        i = bisect_right(indexes, self.position[el])
+        if i < len(indexes) and indexes[i] <= self.end[el]:
+            return self.elements[indexes[i]]
+        return None
+
+    def find_all(self, el, tags, limit=None):
+        """Tag.find_all(tags, limit=...) - descendants with any of the tags, document order"""
+        start, end = self.position[el], self.end[el]
+        found = []
+        for tag in tags:
+            indexes = self.by_tag.get(tag, [])
+            i = bisect_right(indexes, start)
+            while i < len(indexes) and indexes[i] <= end:
+                found.append(indexes[i])
+                i += 1
+        found.sort()
+        if limit is not None:
+            found = found[:limit]
+        return [self.elements[i] for i in found]
+
+    def all(self, tags, limit=None):
+        """soup.find_all(tags) over the whole document (including the root element)"""
+        found = sorted(i for tag in tags for i in self.by_tag.get(tag, []))
+        if limit is not None:
+            found = found[:limit]
+        return [self.elements[i] for i in found]
+
+    def children(self, el, tag):
+        """Tag.find_all(tag, recursive=False)"""
+        return [child for child in el if child.tag == tag]
+
+    def next_elements(self, el, limit):
+        """Tag.find_all_next(limit=...) - the next tags in document order, starting inside el"""
+        start = self.position[el] + 1
+        return self.elements[start:start + limit]
+
+    # ---- text ----
+
+    def text(self, el):
+        """Tag.get_text(strip=True)"""
+        if el not in self._text:
+            self._text[el] = "".join(self._strings(el, strip=True))
+        return self._text[el]
+
+    def raw_text(self, el):
+        """Tag.get_text()"""
+        if el not in self._raw_text:
+            self._raw_text[el] = "".join(self._strings(el, strip=False))
+        return self._raw_text[el]
+
+    def _strings(self, el, strip):
+        clean = str.strip if strip else str
+        if el.text:
+            yield clean(el.text)
+        if el.tag in RAW_TEXT_TAGS:
+            return
+        for child in el:
+            if isinstance(child.tag, str) and child.tag not in RAW_TEXT_TAGS:
+                yield self.text(child) if strip else self.raw_text(child)
+            if child.tail:
+                yield clean(child.tail)
+
+    def markup(self, el):
+        """str(tag) - only used for substring checks"""
+        return etree.tostring(el, encoding="unicode", method="html", with_tail=False)
+
+
+def parse_page(html):
+    """Parse a page (bytes or str) into a PageIndex"""
+    if isinstance(html, bytes):
+        try:
+            html = html.decode("utf-8")
+        except UnicodeDecodeError:
+            pass  # Let lxml sniff the <meta charset>
+    return PageIndex(lxml_html.document_fromstring(html))
+
+
+def find_ul_after(page, heading, max_siblings=None):
+    """Nearest <ul> among the heading's next siblings (or inside a div/section sibling)"""
+    sibling = page.next_sibling(heading)
+    depth = 0
+    while sibling is not None and (max_siblings is None or depth < max_siblings):
+        if sibling.tag == "ul":
+            return sibling
+        if sibling.tag in ["div", "section"]:
+            ul = page.find(sibling, "ul")
+            if ul is not None:
+                return ul
+        sibling = page.next_sibling(sibling)
+        depth += 1
+    return None
+
+
+def extract_salary(page):
+    salary = "Confidential"
+    # Method 1: Find any span/div with salary indicators and currency symbols
+    for elem in page.all(['span', 'div', 'p']):
+        text = page.text(elem)
+        has_currency = any(indicator in text for indicator in SALARY_INDICATORS) or \
+                      any(symbol in text for symbol in CURRENCY_SYMBOLS)
+        if has_currency:
+            if any(char.isdigit() for char in text) and 5 <= len(text) <= 100:
+                if not any(word in text.lower() for word in ['ago', 'day', 'week', 'month', 'year', 'posted']):
+                    return text
+    # Method 2 ("Confidential" / "سري" shown explicitly) resolves to the same default
+    return salary
+
+
+# ---- Job description ----
+
+def description_by_heading(page):
+    """Method 1: <ul> next to a "Job Description" heading"""
+    desc_items = []
+    for heading in page.all(HEADING_TAGS):
+        heading_text = page.text(heading)
+        if "Job Description" in heading_text or "وصف الوظيفة" in heading_text:
+            ul = find_ul_after(page, heading, max_siblings=5)
+            if ul is None:
+                ul = page.find(page.parent(heading), "ul")
+
+            if ul is not None:
+                for li in page.children(ul, "li"):
+                    text = page.text(li)
+                    if (text and
+                        len(text) > 10 and
+                        not text.startswith('•') and
+                        "/jobs/" not in page.markup(li) and
+                        "ago" not in text.lower()):
+                        desc_items.append(text)
+                if desc_items:
+                    break
+    return desc_items
+
+
+def description_by_text(page):
+    """Method 2: first <ul> shortly after any "Job Description" text, stricter filtering"""
+    desc_items = []
+    for string, parent in page.strings:
+        if "Job Description" not in string and "وصف الوظيفة" not in string:
+            continue
+        for element in page.next_elements(parent, 15):
+            if element.tag == "ul":
+                for li in page.children(element, "li"):
+                    text = page.text(li)
+                    if (text and
+                        len(text) > 15 and
+                        "/jobs/" not in page.markup(li) and
+                        not any(word in text.lower() for word in ['ago', 'month', 'day', 'year']) and
+                        not text.startswith('•')):
+                        desc_items.append(text)
+                if desc_items:
+                    break
+        if desc_items:
+            break
+    return desc_items
+
+
+# ---- Job requirements ----
+
+def requirements_by_heading(page):
+    """Method 1: <ul> after a "Job Requirements" / "Requirements" heading"""
+    req_items = []
+    for heading in page.all(HEADING_TAGS):
+        heading_text = page.text(heading)
+        if "Job Requirements" in heading_text or "Requirements" in heading_text or "متطلبات" in heading_text:
+            ul = find_ul_after(page, heading)
+            if ul is not None:
+                for li in page.find_all(ul, ["li"]):
+                    text = page.text(li)
+                    if text and len(text) > 5:
+                        req_items.append(text)
+                if req_items:
+                    break
+    return req_items
+
+
+def requirements_by_text(page):
+    """Method 2: first <ul> shortly after any "Requirements" text"""
+    req_items = []
+    for string, parent in page.strings:
+        if "Requirements" not in string and "متطلبات" not in string:
+            continue
+        for element in page.next_elements(parent, 20):
+            if element.tag == "ul":
+                for li in page.find_all(element, ["li"]):
+                    text = page.text(li)
+                    if text and len(text) > 5:
+                        req_items.append(text)
+                if req_items:
+                    break
+        if req_items:
+            break
+    return req_items
+
+
+def format_requirements(req_items):
+    """Strip any existing bullets (CSS adds them) and keep the first five"""
+    requirements = []
+    for req in req_items[:5]:
+        req_text = req.strip()
+        if req_text.startswith('🔹 '):
+            req_text = req_text[2:].strip()
+        elif req_text.startswith('🔹'):
+            req_text = req_text[1:].strip()
+        elif req_text.startswith('- '):
+            req_text = req_text[2:].strip()
+        elif req_text.startswith('• '):
+            req_text = req_text[2:].strip()
+        requirements.append(req_text)
+    return requirements
+
+
+# ---- Company logo ----
+
+def logo_by_alt(page):
+    """Method 1: img with "logo" in its alt text"""
+    for img in page.all(["img"]):
+        alt_text = img.get("alt", "").lower()
+        src = img.get("src", "")
+        if "logo" in alt_text and src:
+            return src
+    return ""
+
+
+def logo_by_company_heading(page):
+    """Method 2: img next to a company name heading"""
+    for heading in page.all(['h1', 'h2', 'h3']):
+        if "company" in page.raw_text(heading).lower() or "شركة" in page.raw_text(heading):
+            img = page.find(page.parent(heading), "img")
+            if img is not None and img.get("src"):
+                return img.get("src")
+    return ""
+
+
+def logo_by_header_image(page):
+    """Method 3: first non-icon img in the top sections"""
+    for section in page.all(['header', 'section', 'div'], limit=10):
+        img = page.find(section, "img")
+        if img is not None and img.get("src"):
+            src = img.get("src", "")
+            if "icon" not in src.lower() and "avatar" not in src.lower():
+                return src
+    return ""
+
+
+def normalize_logo(company_logo):
+    if company_logo:
+        if company_logo.startswith("//"):
+            company_logo = "https:" + company_logo
+        elif company_logo.startswith("/"):
+            company_logo = "https://wuzzuf.net" + company_logo
+    return company_logo
+
+
+# ---- Skills ----
+
+def skills_by_heading(page):
+    """Method 1: badges in the block after a "Skills" heading"""
+    skills = []
+    for heading in page.all(HEADING_TAGS):
+        heading_text = page.text(heading)
+        if "skill" in heading_text.lower() or "مهارات" in heading_text:
+            skill_elements = []
+            sibling = page.next_sibling(heading)
+            search_count = 0
+            while sibling is not None and search_count < 5:
+                if sibling.tag in ["div", "section", "ul"]:
+                    skill_elements = page.find_all(sibling, ['a', 'span', 'li'])
+                    if skill_elements:
+                        break
+                sibling = page.next_sibling(sibling)
+                search_count += 1
+
+            for elem in skill_elements:
+                text = page.text(elem)
+                if (text and
+                    2 <= len(text) <= 40 and
+                    len(text.split()) <= 6 and
+                    text.lower() not in ['view', 'view all', 'more', 'less', 'see more'] and
+                    text not in skills):
+                    skills.append(text)
+                if len(skills) >= 10:
+                    break
+
+            if skills:
+                break
+    return skills
+
+
+def skills_by_link(page):
+    """Method 2: links with /skill in their href"""
+    skills = []
+    for link in page.all(['a']):
+        if '/skill' not in (link.get('href') or ''):
+            continue
+        text = page.text(link)
+        if text and 2 <= len(text) <= 40 and text not in skills:
+            skills.append(text)
+        if len(skills) >= 10:
+            break
+    return skills
+
+
+def skills_by_text(page):
+    """Method 3: badges inside the element holding any "skill" text"""
+    skills = []
+    for string, parent in page.strings:
+        if "skill" not in string.lower() and "مهارات" not in string:
+            continue
+        for elem in page.find_all(parent, ['a', 'span'], limit=30):
+            text = page.text(elem)
+            if (text and
+                2 <= len(text) <= 40 and
+                len(text.split()) <= 6 and
+                text.lower() not in ['view', 'view all', 'skills', 'skills and tools'] and
+                text not in skills):
+                skills.append(text)
+                if len(skills) >= 10:
+                    break
+        if skills:
+            break
+    return skills
+
+
+def first_hit(registry, field, methods, default):
+    """Run the (name, fn) methods until one finds something; the registry skips cold ones and records them"""
+    if registry is not None:
+        return registry.run("wuzzuf", field, methods, default)
+    for _, method in methods:
+        result = method()
+        if result:
+            return result
+    return default
+
+
+def extract_job_details_fast(html, selenium_skills=None, registry=None):
+    """
+    lxml version of scraper.extract_job_details().
+    selenium_skills is an optional callable returning a skills list; when it returns
+    skills, the static skills lookup is skipped, as in the BeautifulSoup path.
+    registry is an optional strategy_registry.StrategyRegistry: with it, methods
+    that keep missing are skipped and every attempt is recorded. The Method 1 / 2 / 3
+    precedence is the same either way.
+    """
+    page = parse_page(html)
+
+    salary = extract_salary(page)
+
+    desc_items = first_hit(registry, "description", [
+        ("heading", lambda: description_by_heading(page)),
+        ("text", lambda: description_by_text(page)),
+    ], [])
+    description = "\n".join(desc_items) if desc_items else ""
+
+    req_items = first_hit(registry, "requirements", [
+        ("heading", lambda: requirements_by_heading(page)),
+        ("text", lambda: requirements_by_text(page)),
+    ], [])
+    if not req_items and desc_items:
+        print(f"   ℹ️  No Requirements section - using Job Description as requirements")
+        req_items = desc_items[:5]
+    requirements = format_requirements(req_items)
+
+    company_logo = normalize_logo(first_hit(registry, "company_logo", [
+        ("alt", lambda: logo_by_alt(page)),
+        ("company_heading", lambda: logo_by_company_heading(page)),
+        ("header_image", lambda: logo_by_header_image(page)),
+    ], ""))
+
+    skills = selenium_skills() if selenium_skills else []
+    if not skills:
+        skills = first_hit(registry, "skills", [
+            ("heading", lambda: skills_by_heading(page)),
+            ("skill_links", lambda: skills_by_link(page)),
+            ("text", lambda: skills_by_text(page)),
+        ], [])
+
+    return {
+        "salary": salary,
+        "requirements": requirements[:5],
+        "skills": skills[:10],
+        "company_logo": company_logo,
+        "description": description
+    }
@@ -0,0 +1,181 @@
+"""
+Seen-link history for TechFlow scraper
+SQLite (WAL) table of canonical links with their first-seen time, plus the
+fingerprints of jobs already taken (see job_identity) for near-duplicate checks.
+Each link is written as soon as it is seen, so a crashed run keeps what it saw.
+Entries older than HISTORY_TTL_DAYS are evicted when the store is opened. Lookups use the
+primary key, so opening and closing cost the same however long the history is.
+"""
+import os
+import json
+import time
+import sqlite3
+import threading
+
+from job_identity import canonical_link, hamming, NEAR_DUPLICATE_DISTANCE
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+HISTORY_DB_PATH = os.getenv("HISTORY_DB_PATH", os.path.join(SCRIPT_DIR, "history.sqlite"))
+HISTORY_TTL_DAYS = float(os.getenv("HISTORY_TTL_DAYS", "60"))
+LEGACY_HISTORY_FILE = os.path.join(SCRIPT_DIR, "history.json")
+
+# A 64-bit fingerprint split into 4 x 16-bit bands: two fingerprints at most
+# 3 bits apart share at least one band, so only band matches are compared
+# (a NEAR_DUPLICATE_DISTANCE above 3 can miss some matches)
+FINGERPRINT_BANDS = 4
+BAND_BITS = 16
+
+
+def fingerprint_bands(fingerprint):
+    return [(fingerprint >> (band * BAND_BITS)) & ((1 << BAND_BITS) - 1) for band in range(FINGERPRINT_BANDS)]
+
+
+def to_signed(fingerprint):
+    """SQLite integers are signed 64-bit"""
+    return fingerprint - (1 << 64) if fingerprint >= 1 << 63 else fingerprint
+
+
+class HistoryView:
+    """Read-only view of the links a store had before `until` (not the ones added since)"""
+
+    def __init__(self, store, until):
+        self.store = store
+        self.until = until
+
+    def __contains__(self, link):
+        first_seen = self.store.first_seen(link)
+        return first_seen is not None and first_seen < self.until
+
+
+class HistoryStore:
+    """
+    Set-like store (`in`, add, discard, len) shared by every thread in the process.
+    Writes go straight to disk; nothing is held in memory.
+    """
+
+    def __init__(self, path=HISTORY_DB_PATH, ttl_days=HISTORY_TTL_DAYS):
+        self.path = path
+        self.ttl = ttl_days * 24 * 3600
+        self.opened_at = time.time()
+        self._lock = threading.Lock()
+        # Autocommit: every add is its own small WAL write
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS seen_links (
+                link TEXT PRIMARY KEY,
+                first_seen REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_seen_links_first_seen ON seen_links (first_seen)")
+        # Near-duplicate index: kind is "card" (title + company) or "content" (+ requirements)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS fingerprints (
+                link TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                fingerprint INTEGER NOT NULL,
+                b0 INTEGER NOT NULL, b1 INTEGER NOT NULL, b2 INTEGER NOT NULL, b3 INTEGER NOT NULL,
+                first_seen REAL NOT NULL,
+                PRIMARY KEY (link, kind)
+            )
+        """)
+        for band in range(FINGERPRINT_BANDS):
+            self._db.execute(f"CREATE INDEX IF NOT EXISTS idx_fingerprints_b{band} ON fingerprints (kind, b{band})")
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_fingerprints_first_seen ON fingerprints (first_seen)")
+        self.evicted = self.evict()
+
+    def first_seen(self, link):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT first_seen FROM seen_links WHERE link = ?", (canonical_link(link),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def __contains__(self, link):
+        return self.first_seen(link) is not None
+
+    def add(self, link, first_seen=None):
+        """Record a link (keeps the original first-seen time if it is already there)"""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR IGNORE INTO seen_links (link, first_seen) VALUES (?, ?)",
+                (canonical_link(link), first_seen or time.time()),
+            )
+
+    def update(self, links, first_seen=None):
+        """Record many links in one transaction"""
+        rows = [(canonical_link(link), first_seen or time.time()) for link in links if link]
+        with self._lock:
+            self._db.execute("BEGIN")
+            self._db.executemany("INSERT OR IGNORE INTO seen_links (link, first_seen) VALUES (?, ?)", rows)
+            self._db.execute("COMMIT")
+
+    def discard(self, link):
+        link = canonical_link(link)
+        with self._lock:
+            self._db.execute("DELETE FROM seen_links WHERE link = ?", (link,))
+            self._db.execute("DELETE FROM fingerprints WHERE link = ?", (link,))
+
+    def add_fingerprint(self, link, kind, fingerprint):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO fingerprints (link, kind, fingerprint, b0, b1, b2, b3, first_seen) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (canonical_link(link), kind, to_signed(fingerprint), *fingerprint_bands(fingerprint), time.time()),
+            )
+
+    def find_near_duplicate(self, kind, fingerprint, max_distance=NEAR_DUPLICATE_DISTANCE):
+        """Link of a stored job whose fingerprint is within max_distance bits, or None"""
+        bands = fingerprint_bands(fingerprint)
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT link, fingerprint FROM fingerprints WHERE kind = ? "
+                "AND (b0 = ? OR b1 = ? OR b2 = ? OR b3 = ?)", (kind, *bands)
+            ).fetchall()
+        for link, stored in rows:
+            if hamming(stored & ((1 << 64) - 1), fingerprint) <= max_distance:
+                return link
+        return None
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM seen_links").fetchone()[0]
+
+    def snapshot(self):
+        """Links seen before this store was opened (i.e. by earlier runs)"""
+        return HistoryView(self, self.opened_at)
+
+    def evict(self):
+        """Drop links first seen more than ttl seconds ago; returns how many"""
+        if self.ttl <= 0:
+            return 0
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            cursor = self._db.execute("DELETE FROM seen_links WHERE first_seen < ?", (cutoff,))
+            self._db.execute("DELETE FROM fingerprints WHERE first_seen < ?", (cutoff,))
+        return cursor.rowcount
+
+    def import_legacy(self, path=LEGACY_HISTORY_FILE):
+        """
+        One-time move of the old history.json (a JSON list of links) into the store.
+        The links are dated by the file's mtime and the file is renamed so this never runs again.
+        """
+        if not os.path.exists(path):
+            return 0
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read().strip()
+            links = json.loads(content) if content else []
+            self.update(links, first_seen=os.path.getmtime(path))
+            os.replace(path, path + ".migrated")
+        except (OSError, ValueError, sqlite3.Error) as e:
+            print(f"⚠️  Warning: Could not import {path}: {e}")
+            return 0
+        print(f"📦 Imported {len(links)} links from {os.path.basename(path)} into the history store")
+        return len(links)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,173 @@
+"""
+Persistent HTTP response cache for TechFlow scraper
+SQLite-backed, revalidates with ETag / Last-Modified, per-URL-class TTLs and an LRU size budget
+"""
+import os
+import json
+import time
+import zlib
+import sqlite3
+import threading
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "1") == "1"
+HTTP_CACHE_PATH = os.getenv("HTTP_CACHE_PATH", os.path.join(SCRIPT_DIR, "http_cache.sqlite"))
+HTTP_CACHE_MAX_MB = float(os.getenv("HTTP_CACHE_MAX_MB", "200"))
+
+# Seconds a cached page is served without asking the server again.
+# Search results change quickly; a job page rarely changes after it is posted.
+HTTP_CACHE_SEARCH_TTL = int(os.getenv("HTTP_CACHE_SEARCH_TTL", "900"))
+HTTP_CACHE_DETAIL_TTL = int(os.getenv("HTTP_CACHE_DETAIL_TTL", str(3 * 24 * 3600)))
+
+# (url fragment, ttl) - first match wins; other URLs are only revalidated, never served blind
+URL_CLASS_TTLS = [
+    ("/jobs/p/", HTTP_CACHE_DETAIL_TTL),
+    ("/search/jobs", HTTP_CACHE_SEARCH_TTL),
+]
+
+
+def ttl_for(url):
+    for fragment, ttl in URL_CLASS_TTLS:
+        if fragment in url:
+            return ttl
+    return 0
+
+
+class CachedResponse:
+    """Minimal stand-in for requests/httpx responses served from the cache"""
+
+    def __init__(self, url, status_code, headers, content):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.from_cache = True
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class HttpCache:
+    """
+    url -> (body, validators) store shared by every thread in the process.
+    Bodies are zlib-compressed; least recently used entries are evicted once
+    the total stored size exceeds max_bytes.
+    """
+
+    def __init__(self, path=HTTP_CACHE_PATH, max_bytes=HTTP_CACHE_MAX_MB * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)")
+        self._db.commit()
+
+    def lookup(self, url):
+        """Return the cached entry for url as a dict, or None"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status, headers, body, fetched_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if not row:
+                return None
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), url))
+            self._db.commit()
+        status, headers, body, fetched_at = row
+        return {
+            "url": url,
+            "status": status,
+            "headers": json.loads(headers),
+            "body": zlib.decompress(body),
+            "fetched_at": fetched_at,
+        }
+
+    def is_fresh(self, entry):
+        return time.time() - entry["fetched_at"] < ttl_for(entry["url"])
+
+    def validators(self, entry):
+        """Conditional request headers for revalidating entry"""
+        headers = {}
+        if not entry:
+            return headers
+        if entry["headers"].get("etag"):
+            headers["If-None-Match"] = entry["headers"]["etag"]
+        if entry["headers"].get("last-modified"):
+            headers["If-Modified-Since"] = entry["headers"]["last-modified"]
+        return headers
+
+    def response(self, entry):
+        return CachedResponse(entry["url"], entry["status"], entry["headers"], entry["body"])
+
+    def store(self, url, response):
+        """Cache a 200 response (requests or httpx) and enforce the size budget"""
+        headers = {k.lower(): v for k, v in response.headers.items()
+                   if k.lower() in ("etag", "last-modified", "content-type")}
+        body = zlib.compress(response.content)
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (url, status, headers, body, size, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, response.status_code, json.dumps(headers), body, len(body), now, now),
+            )
+            self._evict()
+            self._db.commit()
+
+    def refresh(self, url):
+        """Mark an entry as just revalidated (server answered 304 Not Modified)"""
+        now = time.time()
+        with self._lock:
+            self._db.execute("UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE url = ?", (now, now, url))
+            self._db.commit()
+
+    def _evict(self):
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Drop least recently used entries until we are back under budget
+        for url, size in self._db.execute("SELECT url, size FROM responses ORDER BY accessed_at").fetchall():
+            self._db.execute("DELETE FROM responses WHERE url = ?", (url,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """Return the process-wide HttpCache, or None when HTTP_CACHE_ENABLED=0 or the file can't be opened"""
+    global _cache
+    if not HTTP_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = HttpCache()
+                except sqlite3.Error as e:
+                    print(f"⚠️  HTTP cache disabled, could not open {HTTP_CACHE_PATH}: {e}")
+                    return None
+    return _cache
@@ -0,0 +1,241 @@
+"""
+Shared HTTP client for TechFlow scraper
+Pooled keep-alive sessions, timeouts, retries with jittered backoff and per-host concurrency caps
+"""
+import os
+import time
+import random
+import asyncio
+import threading
+from urllib.parse import urlparse
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_cache import get_cache
+
+# Timeouts (seconds) - a slow host must never hang a scheduled run
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "20"))
+
+# Retry policy for transient failures (5xx / 429 / connection errors)
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+HTTP_BACKOFF_BASE = float(os.getenv("HTTP_BACKOFF_BASE", "0.5"))
+HTTP_BACKOFF_MAX = float(os.getenv("HTTP_BACKOFF_MAX", "10"))
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Connection pool size and concurrent requests allowed per host
+HTTP_MAX_PER_HOST = int(os.getenv("HTTP_MAX_PER_HOST", "8"))
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+def backoff_delay(attempt, response=None):
+    """Exponential backoff with full jitter, honouring Retry-After when the server sends it"""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), HTTP_BACKOFF_MAX)
+    return random.uniform(0, min(HTTP_BACKOFF_MAX, HTTP_BACKOFF_BASE * (2 ** attempt)))
+
+
+class HttpClient:
+    """
+    One keep-alive session shared by every fetch in a run.
+    requests keeps a separate connection pool per host, so repeated calls to
+    wuzzuf.net / api.telegram.org reuse the same TLS connections.
+    """
+
+    def __init__(self, connect_timeout=HTTP_CONNECT_TIMEOUT, read_timeout=HTTP_READ_TIMEOUT,
+                 max_retries=HTTP_MAX_RETRIES, max_per_host=HTTP_MAX_PER_HOST, cache=None):
+        self.timeout = (connect_timeout, read_timeout)
+        self.cache = cache
+        self.max_retries = max_retries
+        self.max_per_host = max_per_host
+
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max_per_host, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._host_limits = {}
+        self._host_limits_lock = threading.Lock()
+
+    def _host_semaphore(self, url):
+        host = urlparse(url).netloc.lower()
+        with self._host_limits_lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_limits[host]
+
+    def request(self, method, url, retry_statuses=RETRY_STATUSES, **kwargs):
+        """
+        Send a request through the shared session.
+        Retries on connection errors and retry_statuses; returns the last response
+        (even if it is still an error status) or raises the last connection error.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        semaphore = self._host_semaphore(url)
+
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            try:
+                with semaphore:
+                    response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if last_attempt:
+                    raise
+                delay = backoff_delay(attempt)
+                print(f"   ⚠️  {method} {url} failed ({e.__class__.__name__}), retrying in {delay:.1f}s...")
+                time.sleep(delay)
+                continue
+
+            if response.status_code in retry_statuses and not last_attempt:
+                delay = backoff_delay(attempt, response)
+                print(f"   ⚠️  {method} {url} returned {response.status_code}, retrying in {delay:.1f}s...")
+                time.sleep(delay)
+                continue
+
+            return response
+
+    def get(self, url, use_cache=False, **kwargs):
+        """
+        GET through the shared session. With use_cache, fresh cached pages are served
+        without a request and stale ones are revalidated with If-None-Match / If-Modified-Since.
+        """
+        if not use_cache or self.cache is None:
+            return self.request("GET", url, **kwargs)
+
+        entry = self.cache.lookup(url)
+        if entry and self.cache.is_fresh(entry):
+            return self.cache.response(entry)
+
+        kwargs["headers"] = {**(kwargs.get("headers") or {}), **self.cache.validators(entry)}
+        response = self.request("GET", url, **kwargs)
+        if entry and response.status_code == 304:
+            self.cache.refresh(url)
+            return self.cache.response(entry)
+        if response.status_code == 200:
+            self.cache.store(url, response)
+        return response
+
+    def post(self, url, **kwargs):
+        # POSTs are not idempotent (Telegram / WhatsApp would double-send),
+        # so only retry when the server explicitly rejected the request
+        kwargs.setdefault("retry_statuses", (429,))
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+class AsyncHttpClient:
+    """
+    asyncio counterpart of HttpClient (httpx), used by the async scraping engine.
+    Create it inside the running event loop: `async with AsyncHttpClient() as client`.
+    """
+
+    def __init__(self, connect_timeout=HTTP_CONNECT_TIMEOUT, read_timeout=HTTP_READ_TIMEOUT,
+                 max_retries=HTTP_MAX_RETRIES, max_per_host=HTTP_MAX_PER_HOST, cache=None):
+        self.cache = cache if cache is not None else get_cache()
+        self.max_retries = max_retries
+        self.max_per_host = max_per_host
+        self.client = httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(max_keepalive_connections=max_per_host * 4),
+            follow_redirects=True,
+        )
+        self._host_limits = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    def _host_semaphore(self, url):
+        host = urlparse(url).netloc.lower()
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.max_per_host)
+        return self._host_limits[host]
+
+    async def request(self, method, url, retry_statuses=RETRY_STATUSES, **kwargs):
+        """Same retry contract as HttpClient.request"""
+        semaphore = self._host_semaphore(url)
+
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            try:
+                async with semaphore:
+                    response = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if last_attempt:
+                    raise
+                delay = backoff_delay(attempt)
+                print(f"   ⚠️  {method} {url} failed ({e.__class__.__name__}), retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+                continue
+
+            if response.status_code in retry_statuses and not last_attempt:
+                delay = backoff_delay(attempt, response)
+                print(f"   ⚠️  {method} {url} returned {response.status_code}, retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+                continue
+
+            return response
+
+    async def get(self, url, use_cache=False, **kwargs):
+        """
+        Same caching contract as HttpClient.get. The cache's SQLite reads/writes and
+        zlib work run in a worker thread so a slow commit never stalls the event loop.
+        """
+        if not use_cache or self.cache is None:
+            return await self.request("GET", url, **kwargs)
+
+        entry = await asyncio.to_thread(self.cache.lookup, url)
+        if entry and self.cache.is_fresh(entry):
+            return self.cache.response(entry)
+
+        kwargs["headers"] = {**(kwargs.get("headers") or {}), **self.cache.validators(entry)}
+        response = await self.request("GET", url, **kwargs)
+        if entry and response.status_code == 304:
+            await asyncio.to_thread(self.cache.refresh, url)
+            return self.cache.response(entry)
+        if response.status_code == 200:
+            await asyncio.to_thread(self.cache.store, url, response)
+        return response
+
+    async def post(self, url, **kwargs):
+        kwargs.setdefault("retry_statuses", (429,))
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self):
+        await self.client.aclose()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Return the process-wide HttpClient, creating it on first use"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient(cache=get_cache())
+    return _client
+
+
+def http_get(url, **kwargs):
+    return get_client().get(url, **kwargs)
+
+
+def http_post(url, **kwargs):
+    return get_client().post(url, **kwargs)
@@ -0,0 +1,80 @@
+"""
+Browser-to-HTTP handoff for Indeed job pages
+The uc.Chrome search session clears Cloudflare once; its cookies (cf_clearance,
+CTK, ...) and user agent are copied into a plain keep-alive HTTP session, so
+viewjob pages - server-rendered HTML - are fetched without rendering them.
+Any page that comes back as a challenge is left for the browser.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from http_client import HttpClient
+
+# Set INDEED_HTTP_DETAILS=0 to always render job pages in the browser
+INDEED_HTTP_DETAILS = os.getenv("INDEED_HTTP_DETAILS", "1") == "1"
+INDEED_HTTP_WORKERS = int(os.getenv("INDEED_HTTP_WORKERS", "4"))
+# Give up on HTTP for the rest of the run after this many challenges in a row
+INDEED_HTTP_MAX_CHALLENGES = 3
+
+CHALLENGE_STATUSES = (403, 429, 503)
+CHALLENGE_MARKERS = ("challenge-platform", "cf-chl", "Just a moment...", "Verify you are human")
+
+
+def is_challenge(response):
+    """Cloudflare challenge / block page instead of the job page"""
+    if response.status_code in CHALLENGE_STATUSES:
+        return True
+    return any(marker in response.text for marker in CHALLENGE_MARKERS)
+
+
+class IndeedHttpSession:
+    """Plain HTTP session carrying a browser's Cloudflare clearance"""
+
+    def __init__(self, driver, workers=INDEED_HTTP_WORKERS):
+        # No retries: a challenge or error goes straight to the browser fallback
+        self.client = HttpClient(max_retries=0, cache=None)
+        self.workers = max(1, workers)
+        self.challenges = 0
+        self.stats = {"http": 0, "fallback": 0}
+        self.sync_from(driver)
+
+    @property
+    def enabled(self):
+        return self.challenges < INDEED_HTTP_MAX_CHALLENGES
+
+    def sync_from(self, driver):
+        """Copy the browser's cookies and user agent (again after it re-clears a challenge)"""
+        session = self.client.session
+        session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent;")
+        for cookie in driver.get_cookies():
+            session.cookies.set(cookie["name"], cookie["value"],
+                                domain=cookie.get("domain"), path=cookie.get("path", "/"))
+
+    def fetch(self, url):
+        """Job page HTML, or None when the page needs the browser"""
+        if not self.enabled:
+            return None
+        try:
+            response = self.client.get(url, retry_statuses=())
+        except Exception as e:
+            print(f"   ⚠️  HTTP fetch failed for {url}: {e}")
+            return None
+        if is_challenge(response) or "jobDescriptionText" not in response.text:
+            self.challenges += 1
+            if not self.enabled:
+                print("   ⚠️  Indeed keeps challenging plain HTTP, using the browser for the rest of the run")
+            return None
+        self.challenges = 0
+        return response.text
+
+    def fetch_many(self, urls):
+        """{url: html} for the pages HTTP could get; the rest are missing from the dict"""
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pages = dict(zip(urls, executor.map(self.fetch, urls)))
+        fetched = {url: html for url, html in pages.items() if html}
+        self.stats["http"] += len(fetched)
+        self.stats["fallback"] += len(urls) - len(fetched)
+        return fetched
+
+    def close(self):
+        self.client.close()
@@ -0,0 +1,114 @@
+"""
+Job identity for TechFlow scraper
+Stable keys for one posting reached through different URLs (Wuzzuf /jobs/p/<id>,
+Indeed jk) and 64-bit SimHash fingerprints for one role posted twice - reposted
+under a new id, or on both Wuzzuf and Indeed. Fingerprints a few bits apart
+(NEAR_DUPLICATE_DISTANCE) are the same job.
+"""
+import os
+import re
+import hashlib
+import unicodedata
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+NEAR_DUPLICATE_DISTANCE = int(os.getenv("NEAR_DUPLICATE_DISTANCE", "3"))
+FINGERPRINT_BITS = 64
+
+# wuzzuf.net/jobs/p/<id>-<title-slug>
+WUZZUF_JOB_ID = re.compile(r"/jobs/p/([A-Za-z0-9]+)")
+
+# Query parameters that identify the job; everything else is tracking (o=, l=, t=, a=, from=, ...)
+IDENTITY_PARAMS = {"jk"}
+
+# Company names that say nothing about who is hiring
+UNKNOWN_COMPANIES = {"", "unknown", "confidential", "confidential company"}
+COMPANY_NOISE = {"egypt", "misr", "llc", "inc", "ltd", "co", "company", "corp", "corporation",
+                 "group", "sae", "s", "a", "e", "the", "for", "and"}
+TITLE_SYNONYMS = {"sr": "senior", "jr": "junior", "dev": "developer", "eng": "engineer",
+                  "mgr": "manager", "swe": "software engineer"}
+# Title 3x, company 2x, each requirement word 1x: the requirements list is long
+# but the title is what makes two postings the same job
+TITLE_WEIGHT, COMPANY_WEIGHT, REQUIREMENT_WEIGHT = 3, 2, 1
+
+
+def job_key(link):
+    """'wuzzuf:<id>' / 'indeed:<jk>' for job pages of known sources, else None"""
+    parts = urlsplit(link)
+    host = parts.netloc.lower()
+    if "wuzzuf.net" in host:
+        match = WUZZUF_JOB_ID.search(parts.path)
+        return f"wuzzuf:{match.group(1).lower()}" if match else None
+    if "indeed." in host:
+        jk = dict(parse_qsl(parts.query)).get("jk")
+        return f"indeed:{jk}" if jk else None
+    return None
+
+
+def canonical_link(link):
+    """
+    Same job, same URL: Wuzzuf job pages become /jobs/p/<id> (no title slug), Indeed
+    links carrying a jk (viewjob, rc/clk, pagead/clk, ...) become /viewjob?jk=<jk>,
+    everything else loses its fragment, tracking query and trailing slash
+    """
+    parts = urlsplit(link.strip())
+    key = job_key(link)
+    if key:
+        source, job_id = key.split(":", 1)
+        if source == "wuzzuf":
+            return f"https://wuzzuf.net/jobs/p/{job_id}"
+        return f"https://{parts.netloc.lower()}/viewjob?jk={job_id}"
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query) if k in IDENTITY_PARAMS])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), query, ""))
+
+
+def tokens(text):
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    return re.findall(r"\w+", text)
+
+
+def title_tokens(title):
+    words = " ".join(TITLE_SYNONYMS.get(word, word) for word in tokens(title)).split()
+    # Word pairs too, so "senior developer" and "developer senior" differ a little
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def company_tokens(company):
+    words = tokens(company)
+    if " ".join(words) in UNKNOWN_COMPANIES:
+        return []
+    return [word for word in words if word not in COMPANY_NOISE]
+
+
+def known_company(company):
+    """False for "Confidential"/"Unknown" - too little to call two postings the same"""
+    return bool(company_tokens(company))
+
+
+def simhash(weighted_features):
+    """64-bit SimHash of (feature, weight) pairs"""
+    counts = [0] * FINGERPRINT_BITS
+    for feature, weight in weighted_features:
+        digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+        for bit in range(FINGERPRINT_BITS):
+            counts[bit] += weight if digest >> bit & 1 else -weight
+    return sum(1 << bit for bit, count in enumerate(counts) if count > 0)
+
+
+def card_fingerprint(title, company):
+    """From the search card alone (before the detail fetch)"""
+    features = [(f"t:{word}", TITLE_WEIGHT) for word in title_tokens(title)]
+    features += [(f"c:{word}", COMPANY_WEIGHT) for word in company_tokens(company)]
+    return simhash(features)
+
+
+def content_fingerprint(title, company, requirements):
+    """From the full job (title + company + requirements), checked before publishing"""
+    features = [(f"t:{word}", TITLE_WEIGHT) for word in title_tokens(title)]
+    features += [(f"c:{word}", COMPANY_WEIGHT) for word in company_tokens(company)]
+    for requirement in requirements or []:
+        features += [(f"r:{word}", REQUIREMENT_WEIGHT) for word in tokens(requirement)]
+    return simhash(features)
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
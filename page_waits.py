@@ -0,0 +1,78 @@
+"""
+Readiness waits for the Selenium paths of TechFlow scraper
+Each wait returns as soon as the content it needs is in the DOM instead of
+sleeping a fixed time, and gives up after the source's timeout budget.
+"""
+import os
+
+try:
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    SELENIUM_AVAILABLE = False
+
+# Seconds one wait may take before we read whatever the page has
+WAIT_TIMEOUTS = {
+    "wuzzuf": float(os.getenv("WUZZUF_WAIT_TIMEOUT", "10")),
+    "indeed": float(os.getenv("INDEED_WAIT_TIMEOUT", "15")),
+}
+WAIT_POLL_INTERVAL = 0.2
+
+# Indeed search page: result cards, or the "no jobs found" message
+INDEED_RESULTS_SELECTOR = (
+    "#mosaic-provider-jobcards div.job_seen_beacon, div[data-jk], a[data-jk], "
+    ".jobsearch-NoResult-messageContainer"
+)
+# Indeed job page: the description with some text in it
+INDEED_DESCRIPTION_SELECTOR = "#jobDescriptionText, [class*='jobDescriptionText']"
+# Wuzzuf job page: an anchor/span with text inside the block after "Skills And Tools"
+WUZZUF_SKILLS_XPATH = (
+    "//h4[contains(text(), 'Skills And Tools')]/following-sibling::*[1]"
+    "//*[self::a or self::span][normalize-space()]"
+)
+
+
+def wait_until(driver, condition, source, what):
+    """
+    Poll condition(driver) until it returns something truthy or the source's
+    timeout runs out. Returns the condition result, or None on timeout.
+    """
+    try:
+        return WebDriverWait(driver, WAIT_TIMEOUTS[source], poll_frequency=WAIT_POLL_INTERVAL).until(condition)
+    except TimeoutException:
+        print(f"   ⚠️  {source}: {what} not ready after {WAIT_TIMEOUTS[source]:.0f}s, using the page as is")
+        return None
+
+
+def has_text(by, selector):
+    """Condition: an element matching the locator with non-empty text"""
+    def condition(driver):
+        for element in driver.find_elements(by, selector):
+            if element.text.strip():
+                return element
+        return False
+    return condition
+
+
+def present(by, selector):
+    """Condition: any element matching the locator"""
+    def condition(driver):
+        return driver.find_elements(by, selector) or False
+    return condition
+
+
+def wait_for_indeed_results(driver):
+    """Indeed search page: job cards (or the no-results message) rendered"""
+    return wait_until(driver, present(By.CSS_SELECTOR, INDEED_RESULTS_SELECTOR), "indeed", "job cards")
+
+
+def wait_for_indeed_description(driver):
+    """Indeed job page: #jobDescriptionText rendered with its text"""
+    return wait_until(driver, has_text(By.CSS_SELECTOR, INDEED_DESCRIPTION_SELECTOR), "indeed", "job description")
+
+
+def wait_for_wuzzuf_skills(driver):
+    """Wuzzuf job page: the "Skills And Tools" block populated by JS"""
+    return wait_until(driver, present(By.XPATH, WUZZUF_SKILLS_XPATH), "wuzzuf", "skills")
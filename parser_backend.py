@@ -0,0 +1,36 @@
+"""
+HTML parser backend selection for TechFlow scraper
+"fast"  - lxml (C parser): lxml-built soups, the single-pass job page engine and
+          the embedded-JSON search results
+"soup"  - BeautifulSoup on html.parser everywhere (the original behaviour)
+Set PARSER_BACKEND=soup to switch back if a page ever parses differently.
+"""
+import os
+
+from bs4 import BeautifulSoup
+
+PARSER_BACKEND = os.getenv("PARSER_BACKEND", "fast").lower()
+BACKENDS = ("fast", "soup")
+
+try:
+    import lxml  # noqa: F401 - only checking it is installed
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+
+def resolve_backend(backend=None):
+    """The backend to use for a call: explicit argument, else PARSER_BACKEND; "soup" when lxml is missing"""
+    backend = (backend or PARSER_BACKEND).lower()
+    if backend not in BACKENDS:
+        print(f"⚠️  Unknown PARSER_BACKEND '{backend}', using 'fast'")
+        backend = "fast"
+    if backend == "fast" and not LXML_AVAILABLE:
+        return "soup"
+    return backend
+
+
+def make_soup(html, backend=None):
+    """BeautifulSoup tree built by the backend's parser (lxml for "fast", html.parser for "soup")"""
+    features = "lxml" if resolve_backend(backend) == "fast" else "html.parser"
+    return BeautifulSoup(html, features)
@@ -0,0 +1,146 @@
+"""
+Seen-link index for TechFlow scraper
+A Bloom filter over every link in the Supabase jobs table, kept on disk between
+runs and topped up with only the rows added since the last run. A miss means the
+link is definitely not in the table, so no database query is needed; only hits
+(real duplicates, plus ~SEEN_INDEX_ERROR_RATE false positives) are confirmed there.
+Memory is fixed by the filter size (~1.2 MB per million links at 1%), not by the table.
+"""
+import os
+import json
+import math
+import hashlib
+import threading
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+# Set SEEN_INDEX=0 to check every link against the database
+SEEN_INDEX_ENABLED = os.getenv("SEEN_INDEX", "1") == "1"
+SEEN_INDEX_FILE = os.getenv("SEEN_INDEX_FILE", os.path.join(SCRIPT_DIR, "seen_index.bin"))
+SEEN_INDEX_CAPACITY = int(os.getenv("SEEN_INDEX_CAPACITY", "200000"))
+SEEN_INDEX_ERROR_RATE = float(os.getenv("SEEN_INDEX_ERROR_RATE", "0.01"))
+SEEN_INDEX_PAGE_SIZE = 1000  # Rows per Supabase request while loading
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter (double hashing over one blake2b digest)"""
+
+    def __init__(self, capacity, error_rate=SEEN_INDEX_ERROR_RATE, bits=None):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bits if bits is not None else bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key):
+        positions = self._positions(key)
+        if all(self.bits[position >> 3] & (1 << (position & 7)) for position in positions):
+            return  # Already in (or a collision) - keep count honest for the capacity check
+        for position in positions:
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class SeenIndex:
+    """
+    Bloom filter of jobs-table links plus the newest created_at already loaded,
+    so each run only fetches rows inserted since the previous one
+    """
+
+    def __init__(self, path=SEEN_INDEX_FILE, capacity=SEEN_INDEX_CAPACITY):
+        self.path = path
+        self.filter = BloomFilter(capacity)
+        self.loaded_until = None  # created_at of the newest row in the filter
+        self._lock = threading.Lock()
+
+    def might_contain(self, link):
+        """False: definitely not in the jobs table. True: probably (confirm with the database)"""
+        with self._lock:
+            return link in self.filter
+
+    def add(self, link):
+        with self._lock:
+            self.filter.add(link)
+
+    def load(self):
+        """Read the filter saved by the previous run; False when there is none (or it is unreadable)"""
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, "rb") as f:
+                header = json.loads(f.readline())
+                bits = bytearray(f.read())
+            bloom = BloomFilter(header["capacity"], header["error_rate"], bits)
+            if len(bits) != (bloom.size + 7) // 8:
+                raise ValueError("size mismatch")
+            bloom.count = header["count"]
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️  Could not read {self.path}, rebuilding: {e}")
+            return False
+        self.filter = bloom
+        self.loaded_until = header.get("loaded_until")
+        return True
+
+    def save(self):
+        with self._lock:
+            header = {"capacity": self.filter.capacity, "error_rate": self.filter.error_rate,
+                      "count": self.filter.count, "loaded_until": self.loaded_until}
+            data = json.dumps(header).encode("utf-8") + b"\n" + bytes(self.filter.bits)
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️  Could not save seen-link index: {e}")
+
+    def refresh(self, supabase):
+        """Add jobs-table rows created since loaded_until (all rows on the first run). Returns rows added."""
+        since = self.loaded_until  # Fixed while paging so the offsets stay valid
+        added = 0
+        start = 0
+        while True:
+            query = supabase.table("jobs").select("link, created_at").order("created_at")
+            if since:
+                # gte: rows sharing the last timestamp may have arrived after the previous run read it
+                query = query.gte("created_at", since)
+            rows = query.range(start, start + SEEN_INDEX_PAGE_SIZE - 1).execute().data
+            for row in rows:
+                if row.get("link"):
+                    self.add(row["link"])
+                    added += 1
+                if row.get("created_at"):
+                    self.loaded_until = max(self.loaded_until or "", row["created_at"])
+            if len(rows) < SEEN_INDEX_PAGE_SIZE:
+                return added
+            start += SEEN_INDEX_PAGE_SIZE
+
+
+def load_seen_index(supabase, path=SEEN_INDEX_FILE):
+    """
+    Run-start index: saved filter + rows added since. A filter filled past its
+    capacity (false positives climbing) is rebuilt at double the size.
+    Returns None if the table could not be read (callers then query per link).
+    """
+    index = SeenIndex(path)
+    index.load()
+    if index.filter.count > index.filter.capacity:
+        print("🔄 Seen-link index is full, rebuilding with a larger filter...")
+        index = SeenIndex(path, capacity=index.filter.capacity * 2)
+    try:
+        added = index.refresh(supabase)
+    except Exception as e:
+        print(f"⚠️  Could not load seen-link index: {e}")
+        return None
+    index.save()
+    print(f"🧮 Seen-link index: {index.filter.count} links ({added} new)")
+    return index
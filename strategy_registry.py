@@ -0,0 +1,154 @@
+"""
+Extraction strategy memory for TechFlow scraper
+Keeps per-method hit rates for each field of each source across runs. Methods
+always run in their fixed precedence order (most precise first); a method that
+keeps missing is skipped, and retried every so often in case the layout comes back.
+"""
+import os
+import json
+import time
+import threading
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+STRATEGY_STATS_FILE = os.getenv("STRATEGY_STATS_FILE", os.path.join(SCRIPT_DIR, "extraction_strategies.json"))
+# Set STRATEGY_ADAPTIVE=0 to always run every method (attempts are still recorded)
+STRATEGY_ADAPTIVE = os.getenv("STRATEGY_ADAPTIVE", "1") == "1"
+# A method that missed this many times in a row is skipped...
+STRATEGY_SKIP_AFTER = int(os.getenv("STRATEGY_SKIP_AFTER", "20"))
+# ...except on every Nth call for its field, when it is tried again
+STRATEGY_RETRY_EVERY = int(os.getenv("STRATEGY_RETRY_EVERY", "10"))
+
+
+class StrategyRegistry:
+    """
+    stats layout (also the JSON file layout):
+    {source: {field: {"winner": method, "methods": {method: {"tries": n, "hits": n,
+                                                             "last_hit": ts, "misses_in_a_row": n}}}}}
+    """
+
+    def __init__(self, path=STRATEGY_STATS_FILE, adaptive=STRATEGY_ADAPTIVE,
+                 skip_after=STRATEGY_SKIP_AFTER, retry_every=STRATEGY_RETRY_EVERY):
+        self.path = path
+        self.adaptive = adaptive
+        self.skip_after = skip_after
+        self.retry_every = max(1, retry_every)
+        self._lock = threading.Lock()
+        self.stats = self._load()
+        self.session = {}  # Same layout, current run only (for the run summary)
+        self._calls = {}  # (source, field) -> run() calls, for the periodic retries
+
+    def _load(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Could not read {self.path}, starting fresh: {e}")
+        return {}
+
+    def _field(self, stats, source, field):
+        return stats.setdefault(source, {}).setdefault(field, {"winner": None, "methods": {}})
+
+    def is_cold(self, source, field, name):
+        """True for a method that missed skip_after times in a row"""
+        with self._lock:
+            method = self._field(self.stats, source, field)["methods"].get(name, {})
+        return method.get("misses_in_a_row", 0) >= self.skip_after
+
+    def ordered(self, source, field, methods):
+        """
+        methods is a list of (name, fn) in precedence order. Returns (active, cold):
+        the methods to try, in that same order, and the skipped ones (tried only
+        if every active method misses). Nothing is skipped on retry calls.
+        """
+        if not self.adaptive or self.skip_after <= 0:
+            return list(methods), []
+        with self._lock:
+            calls = self._calls[(source, field)] = self._calls.get((source, field), 0) + 1
+        if calls % self.retry_every == 0:
+            return list(methods), []
+        active = [method for method in methods if not self.is_cold(source, field, method[0])]
+        cold = [method for method in methods if method not in active]
+        return active, cold
+
+    def record(self, source, field, name, hit):
+        now = time.time()
+        with self._lock:
+            for stats in (self.stats, self.session):
+                entry = self._field(stats, source, field)
+                method = entry["methods"].setdefault(name, {"tries": 0, "hits": 0, "last_hit": None})
+                method["tries"] += 1
+                if hit:
+                    method["hits"] += 1
+                    method["last_hit"] = now
+                    method["misses_in_a_row"] = 0
+                    entry["winner"] = name
+                else:
+                    method["misses_in_a_row"] = method.get("misses_in_a_row", 0) + 1
+
+    def reset_session(self):
+        """Start a new run's tally (the registry outlives runs in the backend)"""
+        with self._lock:
+            self.session = {}
+
+    def run(self, source, field, methods, default=None):
+        """
+        Call each (name, fn) in precedence order, leaving out methods that keep
+        missing, until one returns a truthy result; the skipped ones are the last
+        resort. Every attempt is recorded.
+        """
+        active, cold = self.ordered(source, field, methods)
+        for name, method in active + cold:
+            result = method()
+            self.record(source, field, name, bool(result))
+            if result:
+                return result
+        return default
+
+    def hit_rates(self, session_only=False):
+        """{source: {field: {"winner": name, "methods": {name: {"tries", "hits", "hit_rate"}}}}}"""
+        with self._lock:
+            stats = json.loads(json.dumps(self.session if session_only else self.stats))
+        for fields in stats.values():
+            for entry in fields.values():
+                for method in entry["methods"].values():
+                    method["hit_rate"] = round(method["hits"] / method["tries"], 3) if method["tries"] else None
+        return stats
+
+    def save(self):
+        with self._lock:
+            data = json.dumps(self.stats, indent=2)
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.write(data)
+        except OSError as e:
+            print(f"⚠️  Could not save extraction strategy stats: {e}")
+
+    def print_summary(self):
+        """Print this run's hit rates; fallbacks doing the work point at a layout change"""
+        rates = self.hit_rates(session_only=True)
+        if not rates:
+            return
+        print("\n🧭 Extraction Strategies (this run):")
+        print("-"*60)
+        for source, fields in rates.items():
+            for field, entry in fields.items():
+                methods = ", ".join(
+                    f"{name} {m['hits']}/{m['tries']}" for name, m in entry["methods"].items()
+                )
+                print(f"  {source + '.' + field:<30} {methods}")
+        print("-"*60)
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry():
+    """Return the process-wide StrategyRegistry"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = StrategyRegistry()
+    return _registry
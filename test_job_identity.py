@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Job identity check: the different URLs one posting is reached through must
+canonicalize to the same history key.
+Run after touching job_identity.py.
+"""
+
+import os
+import sys
+
+# Add script directory
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
+
+from job_identity import canonical_link, job_key
+
+
+def test_indeed_link_forms():
+    """viewjob?jk=X and rc/clk?jk=X (with tracking params) are one job"""
+    viewjob = "https://eg.indeed.com/viewjob?jk=3f2a9c1b7d4e5f60&from=serp&vjs=3"
+    click = "https://eg.indeed.com/rc/clk?jk=3f2a9c1b7d4e5f60&bb=abc&xkcb=SoD&fccid=123"
+    assert job_key(viewjob) == job_key(click) == "indeed:3f2a9c1b7d4e5f60"
+    assert canonical_link(viewjob) == canonical_link(click) == "https://eg.indeed.com/viewjob?jk=3f2a9c1b7d4e5f60", \
+        f"{canonical_link(viewjob)} != {canonical_link(click)}"
+
+
+def test_wuzzuf_link_forms():
+    """The title slug and tracking query do not change a Wuzzuf job's key"""
+    slugged = "https://wuzzuf.net/jobs/p/AbC123xyz-Senior-Python-Developer-Cairo-Egypt?o=4&l=sp&t=sj"
+    bare = "https://wuzzuf.net/jobs/p/abc123xyz"
+    assert canonical_link(slugged) == canonical_link(bare) == "https://wuzzuf.net/jobs/p/abc123xyz"
+
+
+def test_other_links():
+    """Links without a job id only lose their fragment, tracking query and trailing slash"""
+    assert canonical_link("https://Example.com/careers/123/?utm_source=x#apply") == "https://example.com/careers/123"
+
+
+if __name__ == "__main__":
+    test_indeed_link_forms()
+    test_wuzzuf_link_forms()
+    test_other_links()
+    print("✅ Every URL form maps to one key")
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Parser backend parity check: run the "fast" (lxml) and "soup" (html.parser)
+backends over the saved fixture pages and make sure they extract the same fields.
+Run after touching fast_extractor.py, parser_backend.py or the extract_* functions.
+"""
+
+import os
+import sys
+import random
+import tempfile
+
+# Add script directory
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
+
+# Keep the real strategy stats file untouched (adaptive mode stays on, as in production)
+os.environ["STRATEGY_STATS_FILE"] = os.path.join(tempfile.gettempdir(), "parity_strategies.json")
+
+from parser_backend import make_soup, LXML_AVAILABLE
+from scraper import (
+    extract_job_details, extract_indeed_job_details, parse_wuzzuf_search_html,
+    find_wuzzuf_job_cards, find_wuzzuf_card_link, wuzzuf_card_link,
+    wuzzuf_card_location, wuzzuf_card_posted_time,
+)
+
+WUZZUF_FIXTURES = ["debug.html", "test_wuzzuf_post.html"]
+INDEED_FIXTURES = ["debug_indeed_latest.html", os.path.join("backend", "debug_indeed_latest.html")]
+SEARCH_FIXTURES = ["debug.html"]
+FIXTURE_URL = "https://wuzzuf.net/jobs/p/parity-check"
+
+
+def read_fixture(name):
+    path = os.path.join(SCRIPT_DIR, name)
+    if not os.path.exists(path):
+        print(f"⚠️  Fixture not found, skipping: {name}")
+        return None
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def compare(label, fast, soup, mismatches):
+    """Print the per-field result and remember mismatches"""
+    if fast == soup:
+        print(f"   ✅ {label}")
+        return
+    print(f"   ❌ {label}")
+    if isinstance(fast, dict) and isinstance(soup, dict):
+        for key in sorted(set(fast) | set(soup)):
+            if fast.get(key) != soup.get(key):
+                print(f"      {key}:")
+                print(f"        fast: {str(fast.get(key))[:200]}")
+                print(f"        soup: {str(soup.get(key))[:200]}")
+    else:
+        print(f"      fast: {str(fast)[:200]}")
+        print(f"      soup: {str(soup)[:200]}")
+    mismatches.append(label)
+
+
+def dom_card_fields(card):
+    """Everything the search loop reads from a DOM card"""
+    link_tag, title_tag = find_wuzzuf_card_link(card)
+    title = link_tag.get_text(strip=True) if link_tag else ''
+    if not title and title_tag:
+        title = title_tag.get_text(strip=True)
+    return {
+        "link": wuzzuf_card_link(card),
+        "title": title,
+        "location": wuzzuf_card_location(card),
+        "posted": wuzzuf_card_posted_time(card),
+    }
+
+
+def test_job_details():
+    """extract_job_details(): single-pass lxml engine vs the html.parser extractor"""
+    print("\n📄 Job details (extract_job_details)")
+    mismatches = []
+    for name in WUZZUF_FIXTURES:
+        html = read_fixture(name)
+        if html is None:
+            continue
+        fast = extract_job_details(html, FIXTURE_URL, backend="fast")
+        soup = extract_job_details(html, FIXTURE_URL, backend="soup")
+        compare(name, fast, soup, mismatches)
+    assert not mismatches, f"fast and soup job details differ: {', '.join(mismatches)}"
+
+
+def test_indeed_details():
+    """extract_indeed_job_details() on an lxml-built soup vs an html.parser soup"""
+    print("\n📄 Indeed details (extract_indeed_job_details)")
+    mismatches = []
+    for name in INDEED_FIXTURES:
+        html = read_fixture(name)
+        if html is None:
+            continue
+        # The requirement trimming picks 5 or 6 items at random
+        random.seed(0)
+        fast = extract_indeed_job_details(make_soup(html, "fast"))
+        random.seed(0)
+        soup = extract_indeed_job_details(make_soup(html, "soup"))
+        compare(name, fast, soup, mismatches)
+    assert not mismatches, f"fast and soup Indeed details differ: {', '.join(mismatches)}"
+
+
+def test_search_cards():
+    """Search page cards: lxml DOM vs html.parser DOM, and embedded-state records vs DOM"""
+    print("\n🔎 Search cards")
+    mismatches = []
+    for name in SEARCH_FIXTURES:
+        html = read_fixture(name)
+        if html is None:
+            continue
+        fast_cards = [dom_card_fields(card) for card in find_wuzzuf_job_cards(make_soup(html, "fast"))]
+        soup_cards = [dom_card_fields(card) for card in find_wuzzuf_job_cards(make_soup(html, "soup"))]
+        compare(f"{name} (DOM cards)", fast_cards, soup_cards, mismatches)
+
+        # Records only cover cards with a job link; locations differ only in spacing ("Giza,Egypt")
+        records = parse_wuzzuf_search_html(html, backend="fast")
+        if not records or not isinstance(records[0], dict):
+            print(f"   ⚠️  {name}: no embedded state, DOM fallback already compared")
+            continue
+        linked = [card for card in soup_cards if card["link"]]
+        compare(
+            f"{name} (state records)",
+            [(r["link"], r["title"], r["location"].replace(" ", "")) for r in records],
+            [(c["link"], c["title"], c["location"].replace(" ", "")) for c in linked],
+            mismatches,
+        )
+    assert not mismatches, f"fast and soup search cards differ: {', '.join(mismatches)}"
+
+
+if __name__ == "__main__":
+    print("="*60)
+    print("🧪 Parser backend parity: fast (lxml) vs soup (html.parser)")
+    print("="*60)
+    if not LXML_AVAILABLE:
+        print("⚠️  lxml is not installed - both backends fall back to html.parser")
+
+    failures = []
+    for test in (test_job_details, test_indeed_details, test_search_cards):
+        try:
+            test()
+        except AssertionError as e:
+            failures.append(str(e))
+
+    print("\n" + "="*60)
+    if failures:
+        print(f"❌ {len(failures)} check(s) failed:")
+        for failure in failures:
+            print(f"   {failure}")
+        sys.exit(1)
+    print("✅ Both backends extract the same fields")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Strategy registry check: with adaptive mode on, the extraction methods keep
+their fixed precedence - a fallback winning once must not change what later
+pages extract. Run after touching strategy_registry.py or the first_hit() callers.
+"""
+
+import os
+import sys
+import tempfile
+
+# Add script directory
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
+
+from strategy_registry import StrategyRegistry
+from fast_extractor import extract_job_details_fast
+
+WUZZUF_FIXTURES = ["debug.html", "test_wuzzuf_post.html"]
+# The loosest method of each Wuzzuf field
+FALLBACKS = {"description": "text", "requirements": "text", "company_logo": "header_image", "skills": "text"}
+
+
+def new_registry(**kwargs):
+    path = os.path.join(tempfile.mkdtemp(), "strategies.json")
+    return StrategyRegistry(path=path, adaptive=True, **kwargs)
+
+
+def test_fallback_win_keeps_precedence():
+    """A page won by the fallback does not put the fallback first on the next page"""
+    registry = new_registry()
+    methods = lambda precise: [("precise", lambda: precise), ("loose", lambda: "loose")]
+    assert registry.run("src", "field", methods(None)) == "loose"
+    assert registry.run("src", "field", methods("precise")) == "precise"
+
+
+def test_cold_method_skipped_and_retried():
+    """A method that keeps missing is skipped, but retried periodically and as a last resort"""
+    registry = new_registry(skip_after=3, retry_every=5)
+    calls = []
+
+    def precise():
+        calls.append("precise")
+        return None
+
+    methods = [("precise", precise), ("loose", lambda: "loose")]
+    for _ in range(3):
+        registry.run("src", "field", methods)
+    assert calls == ["precise"] * 3
+    registry.run("src", "field", methods)  # 4th call: skipped
+    assert len(calls) == 3
+    registry.run("src", "field", methods)  # 5th call: retried
+    assert len(calls) == 4
+    # Skipped, but still tried when every other method misses
+    assert registry.run("src", "field", [("precise", lambda: "back"), ("loose", lambda: None)]) == "back"
+    assert not registry.is_cold("src", "field", "precise")
+
+
+def test_fixture_output_unchanged_after_fallback_win():
+    """Wuzzuf fixtures extract the same fields with a fresh fixed order and after fallback wins"""
+    for name in WUZZUF_FIXTURES:
+        path = os.path.join(SCRIPT_DIR, name)
+        if not os.path.exists(path):
+            print(f"⚠️  Fixture not found, skipping: {name}")
+            continue
+        with open(path, "rb") as f:
+            html = f.read()
+        registry = new_registry()
+        for field, method in FALLBACKS.items():
+            registry.record("wuzzuf", field, method, True)
+        fixed = extract_job_details_fast(html)
+        adaptive = extract_job_details_fast(html, registry=registry)
+        assert adaptive == fixed, f"{name}: adaptive {adaptive} != fixed {fixed}"
+
+
+if __name__ == "__main__":
+    test_fallback_win_keeps_precedence()
+    test_cold_method_skipped_and_retried()
+    test_fixture_output_unchanged_after_fallback_win()
+    print("✅ Extraction methods keep their precedence")
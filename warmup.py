@@ -0,0 +1,75 @@
+"""
+Pre-warmed scraping runtime for TechFlow backend
+Pays the cold-start costs (undetected-chromedriver patching + Chrome launch,
+Blogger discovery/auth, first TLS handshakes) before a run is triggered, and
+drops warmed browsers again after WARM_IDLE_TIMEOUT seconds without use.
+"""
+import os
+import time
+import threading
+
+from http_client import get_client
+from driver_pool import get_pool, close_idle_drivers
+from scraper import SELENIUM_AVAILABLE, connect_blogger
+
+WARMUP_BROWSERS = [kind.strip() for kind in os.getenv("WARMUP_BROWSERS", "indeed").split(",") if kind.strip()]
+WARM_IDLE_TIMEOUT = int(os.getenv("WARM_IDLE_TIMEOUT", "900"))
+
+# Hosts every run talks to
+WARMUP_HOSTS = ["https://wuzzuf.net/", "https://eg.indeed.com/", "https://api.telegram.org/"]
+
+_reaper = None
+_reaper_lock = threading.Lock()
+
+
+def warm_browsers(kinds=None):
+    """One idle driver per pool kind (the uc.Chrome binary is patched on the first start)"""
+    if not SELENIUM_AVAILABLE:
+        return 0
+    started = 0
+    for kind in kinds or WARMUP_BROWSERS:
+        try:
+            started += get_pool(kind).warm(1)
+            print(f"🔥 Warm {kind} browser ready")
+        except Exception as e:
+            print(f"⚠️  Could not pre-warm {kind} browser: {e}")
+    return started
+
+
+def warm_http(hosts=WARMUP_HOSTS):
+    """Open keep-alive connections to the hosts a run uses"""
+    client = get_client()
+    for url in hosts:
+        try:
+            client.session.head(url, timeout=client.timeout, allow_redirects=False)
+        except Exception as e:
+            print(f"⚠️  Could not pre-connect to {url}: {e}")
+
+
+def _reap_idle():
+    while True:
+        time.sleep(60)
+        closed = close_idle_drivers(WARM_IDLE_TIMEOUT)
+        if closed:
+            print(f"💤 Closed {closed} idle browser(s) after {WARM_IDLE_TIMEOUT}s")
+
+
+def start_idle_reaper():
+    global _reaper
+    with _reaper_lock:
+        if _reaper is None:
+            _reaper = threading.Thread(target=_reap_idle, name="warm-idle-reaper", daemon=True)
+            _reaper.start()
+
+
+def warm_up(browsers=True, blogger=True, http=True):
+    """Warm every selected resource; failures are logged and never block startup"""
+    start = time.time()
+    if http:
+        warm_http()
+    if blogger:
+        connect_blogger(reuse=False)
+    if browsers:
+        warm_browsers()
+    start_idle_reaper()
+    print(f"🔥 Scraping runtime pre-warmed in {time.time() - start:.1f}s")